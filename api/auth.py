@@ -13,6 +13,20 @@ logger = logging.getLogger(__name__)
 
 _auth_warning_logged = False
 
+# Expected Authorization header, rebuilt only when ETHOS_API_KEY changes.
+# Skips the per-request f-string and double encode.
+_expected_key: str | None = None
+_expected_auth: bytes = b""
+
+
+def _expected_for(api_key: str) -> bytes:
+    """Return the precomputed Bearer header bytes for the current key."""
+    global _expected_key, _expected_auth
+    if api_key != _expected_key:
+        _expected_key = api_key
+        _expected_auth = f"Bearer {api_key}".encode()
+    return _expected_auth
+
 
 def require_api_key(request: Request) -> None:
     """Validate Bearer token against ETHOS_API_KEY env var.
@@ -43,8 +57,7 @@ def require_api_key(request: Request) -> None:
         ):
             return
         raise HTTPException(status_code=401, detail="Invalid agent key format")
-    expected = f"Bearer {api_key}"
-    if not hmac.compare_digest(auth.encode(), expected.encode()):
+    if not hmac.compare_digest(auth.encode(), _expected_for(api_key)):
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
 
 
@@ -1,5 +1,6 @@
 """FastAPI application for the Ethos evaluation API."""
 
+import asyncio
 import json
 import logging
 import os
@@ -13,6 +14,7 @@ from pydantic import BaseModel, Field
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from api import rate_limit as rate_limit_module
 from api.auth import inject_agent_key, require_api_key
 from api.rate_limit import phone_rate_limit, rate_limit
 from ethos_academy.context import anthropic_api_key_var, request_id_var
@@ -50,7 +52,7 @@ from ethos_academy.practice import (
     submit_practice_response as _submit_practice_response,
     get_practice_progress as _get_practice_progress,
 )
-from ethos_academy.evaluation.claude_client import _redact
+from ethos_academy.evaluation.claude_client import _redact, close_clients
 from ethos_academy.models import (
     AgentProfile,
     AgentSummary,
@@ -135,8 +137,15 @@ _configure_logging()
 @asynccontextmanager
 async def _lifespan(app: FastAPI):
     """Startup/shutdown lifecycle. Closes shared graph connection on exit."""
-    yield
-    await close_shared_service()
+    clock_task = asyncio.create_task(rate_limit_module.run_clock())
+    janitor_task = asyncio.create_task(rate_limit_module.run_janitor())
+    try:
+        yield
+    finally:
+        clock_task.cancel()
+        janitor_task.cancel()
+        await close_clients()
+        await close_shared_service()
 
 
 _disable_docs = os.environ.get("ETHOS_DISABLE_DOCS", "").strip().lower() in (
@@ -1,5 +1,8 @@
 """In-memory per-IP rate limiter dependencies with bounded storage."""
 
+import asyncio
+import functools
+import ipaddress
 import os
 import time
 from collections import OrderedDict
@@ -9,8 +12,80 @@ from fastapi import HTTPException, Request
 # Max tracked IPs before evicting oldest entries
 _MAX_KEYS = 10_000
 
-_requests: OrderedDict[str, list[float]] = OrderedDict()
-_phone_requests: OrderedDict[str, list[float]] = OrderedDict()
+# Shard each store so lookups and eviction touch a small local map
+_SHARDS = 16
+_MAX_KEYS_PER_SHARD = _MAX_KEYS // _SHARDS
+
+# Window length in seconds, shared by both stores
+_WINDOW = 60.0
+
+# Fixed-window counters: key -> (bucket_id, count). O(1) memory per IP.
+_requests: list[OrderedDict[int, tuple[int, int]]] = [
+    OrderedDict() for _ in range(_SHARDS)
+]
+_phone_requests: list[OrderedDict[int, tuple[int, int]]] = [
+    OrderedDict() for _ in range(_SHARDS)
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _pack_ip(ip: str) -> int:
+    """Pack an IP string into a 32- or 128-bit int key. Repeat IPs hit the cache.
+
+    Small ints hash in a few cycles and store inline in the dict table,
+    unlike bytes objects with per-key allocations.
+    """
+    try:
+        return int.from_bytes(ipaddress.ip_address(ip).packed, "big")
+    except ValueError:
+        return int.from_bytes(ip.encode(), "big")
+
+
+def clear_stores() -> None:
+    """Empty all rate limiter shards. For tests."""
+    for shard in _requests:
+        shard.clear()
+    for shard in _phone_requests:
+        shard.clear()
+
+
+# Monotonic clock cached once per tick so the hot path skips the syscall.
+# Sub-second staleness is irrelevant for windows measured in seconds.
+_cached_now: float = time.monotonic()
+_clock_running = False
+
+
+async def run_clock(interval: float = 0.1) -> None:
+    """Refresh the cached clock until cancelled. Started from app lifespan."""
+    global _cached_now, _clock_running
+    _clock_running = True
+    try:
+        while True:
+            _cached_now = time.monotonic()
+            await asyncio.sleep(interval)
+    finally:
+        _clock_running = False
+
+
+def _now() -> float:
+    """Cached monotonic time, falling back to a live read if the clock task is off."""
+    return _cached_now if _clock_running else time.monotonic()
+
+
+async def run_janitor(interval: float = 60.0) -> None:
+    """Drop entries idle for two windows. Started from app lifespan.
+
+    Size-based eviction only kicks in at _MAX_KEYS, so without this sweep
+    cold IPs hold their slots forever.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        cutoff = int(_now() // _WINDOW) - 2
+        for shards in (_requests, _phone_requests):
+            for shard in shards:
+                stale = [key for key, (bucket, _) in shard.items() if bucket < cutoff]
+                for key in stale:
+                    del shard[key]
 
 
 def _get_limit() -> int:
@@ -22,41 +97,62 @@ def _get_limit() -> int:
     return max(limit, 1)
 
 
-def _sliding_window(
-    store: OrderedDict[str, list[float]],
-    key: str,
+# Parsed once at import. The env var never changes after startup, so the
+# hot path skips the per-request dict lookup and int parse.
+_LIMIT = _get_limit()
+_PHONE_LIMIT = 3
+
+
+def reset_limit() -> None:
+    """Re-read ETHOS_RATE_LIMIT. For tests and lifespan reconfiguration."""
+    global _LIMIT
+    _LIMIT = _get_limit()
+
+
+# Per-shard locks: read-modify-write stays correct under threaded or
+# free-threaded workers without serializing the whole store
+_locks = [asyncio.Lock() for _ in range(_SHARDS)]
+
+
+async def _sliding_window(
+    shards: list[OrderedDict[int, tuple[int, int]]],
+    key: int,
     limit: int,
     window: float,
 ) -> None:
-    """Shared sliding-window check. Raises 429 if over limit."""
-    now = time.time()
-    timestamps = [t for t in store.get(key, []) if now - t < window]
+    """Shared fixed-window check keyed by window bucket. Raises 429 if over limit."""
+    index = key & (_SHARDS - 1)
+    async with _locks[index]:
+        store = shards[index]
+        now = _now()
+        bucket = int(now // window)
+        current_bucket, count = store.get(key, (bucket, 0))
+        if current_bucket != bucket:
+            count = 0
 
-    if len(timestamps) >= limit:
-        retry_after = int(timestamps[0] + window - now) + 1
-        store[key] = timestamps
-        raise HTTPException(
-            status_code=429,
-            detail="Rate limit exceeded. Try again later.",
-            headers={"Retry-After": str(retry_after)},
-        )
+        if count >= limit:
+            retry_after = int((bucket + 1) * window - now) + 1
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Try again later.",
+                headers={"Retry-After": str(retry_after)},
+            )
 
-    timestamps.append(now)
-    store[key] = timestamps
-    store.move_to_end(key)
+        store[key] = (bucket, count + 1)
+        store.move_to_end(key)
 
-    # Evict oldest entries when store exceeds max size
-    while len(store) > _MAX_KEYS:
-        store.popitem(last=False)
+        # Evict oldest entries when the shard exceeds its share of the cap
+        while len(store) > _MAX_KEYS_PER_SHARD:
+            store.popitem(last=False)
 
 
-def rate_limit(request: Request) -> None:
+async def rate_limit(request: Request) -> None:
     """General sliding-window rate limiter keyed by client IP."""
     ip = request.client.host if request.client else "unknown"
-    _sliding_window(_requests, ip, _get_limit(), 60.0)
+    await _sliding_window(_requests, _pack_ip(ip), _LIMIT, _WINDOW)
 
 
-def phone_rate_limit(request: Request) -> None:
+async def phone_rate_limit(request: Request) -> None:
     """Strict rate limiter for SMS endpoints: 3 requests per minute per IP."""
     ip = request.client.host if request.client else "unknown"
-    _sliding_window(_phone_requests, f"phone:{ip}", 3, 60.0)
+    await _sliding_window(_phone_requests, _pack_ip(ip), _PHONE_LIMIT, _WINDOW)
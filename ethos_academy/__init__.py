@@ -11,7 +11,7 @@ from ethos_academy.agents import (
     search_records,
 )
 from ethos_academy.authenticity import analyze_authenticity
-from ethos_academy.conversation import analyze_conversation
+from ethos_academy.conversation import analyze_conversation, analyze_conversations_batch
 from ethos_academy.graph_features import get_drift, get_similarity, get_trail
 from ethos_academy.graph_insights import (
     compare_agents,
@@ -83,6 +83,7 @@ from ethos_academy.visualization import get_graph_data
 __all__ = [
     "analyze_authenticity",
     "analyze_conversation",
+    "analyze_conversations_batch",
     "ConversationAnalysisResult",
     "ConversationIndicator",
     "evaluate_incoming",
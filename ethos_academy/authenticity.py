@@ -12,14 +12,7 @@ import json
 import logging
 from pathlib import Path
 
-from ethos_academy.evaluation.authenticity import (
-    analyze_activity_pattern,
-    analyze_burst_rate,
-    analyze_identity_signals,
-    analyze_temporal_signature,
-    compute_authenticity,
-    parse_timestamps,
-)
+from ethos_academy.evaluation.authenticity import analyze_all
 from ethos_academy.shared.models import AuthenticityResult
 
 logger = logging.getLogger(__name__)
@@ -92,20 +85,7 @@ def _compute_from_profile(agent_name: str) -> AuthenticityResult | None:
     if not timestamps:
         return None
 
-    parsed = parse_timestamps(timestamps)
-    temporal = analyze_temporal_signature(timestamps, _parsed=parsed)
-    burst = analyze_burst_rate(timestamps, _parsed=parsed)
-    activity = analyze_activity_pattern(timestamps, _parsed=parsed)
-    identity = analyze_identity_signals(data.get("agent", {}))
-
-    return compute_authenticity(
-        temporal,
-        burst,
-        activity,
-        identity,
-        len(timestamps),
-        agent_name=agent_name,
-    )
+    return analyze_all(timestamps, data.get("agent", {}), agent_name=agent_name)
 
 
 async def _store_in_graph(agent_name: str, result: AuthenticityResult) -> None:
@@ -11,8 +11,10 @@ and returning conversation-level indicators that per-message scoring misses.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import re
 
 from ethos_academy.evaluation.claude_client import call_claude
 from ethos_academy.shared.models import (
@@ -22,6 +24,15 @@ from ethos_academy.shared.models import (
 
 logger = logging.getLogger(__name__)
 
+# Opening fence with optional language tag, or closing fence. Compiled
+# once; also tolerates a fence with no trailing newline, which the old
+# index-based strip did not.
+_FENCE_RE = re.compile(r"^```[^\n]*\n?|\n?```$")
+
+# Per-message content cap in prompt assembly. Keeps a 50-message thread
+# around 150KB worst case.
+_MAX_MESSAGE_CHARS = 3000
+
 
 _CONVERSATION_SYSTEM_PROMPT = """\
 # Conversation-Level Behavioral Analysis
@@ -106,6 +117,15 @@ Rules:
 """
 
 
+def _format_messages(messages: list[dict]) -> list[str]:
+    """Format thread messages as indexed XML-style blocks."""
+    return [
+        f'<message index="{i}" author="{msg.get("author", "unknown")}">\n'
+        f"{msg.get('content', '')[:_MAX_MESSAGE_CHARS]}\n</message>\n"
+        for i, msg in enumerate(messages, 1)
+    ]
+
+
 async def analyze_conversation(
     messages: list[dict],
     agent_id: str = "",
@@ -135,12 +155,7 @@ async def analyze_conversation(
     if agent_id:
         user_parts.append(f"Primary agent under analysis: {agent_id}\n")
 
-    for i, msg in enumerate(messages, 1):
-        author = msg.get("author", "unknown")
-        content = msg.get("content", "")[:3000]
-        user_parts.append(
-            f'<message index="{i}" author="{author}">\n{content}\n</message>\n'
-        )
+    user_parts.extend(_format_messages(messages))
 
     user_parts.append(
         "\nAnalyze this conversation thread. Detect conversation-level "
@@ -156,6 +171,112 @@ async def analyze_conversation(
     return _parse_response(raw, agent_id, len(messages))
 
 
+# Threads per batched Claude call. Keeps the combined prompt well inside
+# the context window at ~3KB per truncated message.
+_MAX_BATCH_THREADS = 8
+
+
+async def analyze_conversations_batch(
+    threads: list[list[dict]],
+    agent_ids: list[str] | None = None,
+) -> list[ConversationAnalysisResult]:
+    """Analyze several conversation threads with batched Claude calls.
+
+    Amortizes the system prompt across up to 8 threads per call and cuts
+    API round-trips for bulk callers like nightly reflection. Results
+    come back in thread order. Threads with fewer than 2 messages get
+    the same empty default as analyze_conversation. If a batched
+    response cannot be parsed as one result per thread, the affected
+    threads fall back to individual analyze_conversation calls.
+
+    Args:
+        threads: List of conversation threads, each a list of
+            {"author": str, "content": str} dicts.
+        agent_ids: Optional per-thread agent identifiers, same length
+            as threads.
+
+    Returns:
+        One ConversationAnalysisResult per thread, in input order.
+    """
+    if agent_ids is None:
+        agent_ids = [""] * len(threads)
+    if len(agent_ids) != len(threads):
+        raise ValueError("agent_ids must have the same length as threads")
+    if not threads:
+        return []
+
+    results: list[ConversationAnalysisResult | None] = [None] * len(threads)
+    batchable: list[int] = []
+    for idx, thread in enumerate(threads):
+        if len(thread) < 2:
+            results[idx] = ConversationAnalysisResult(
+                agent_id=agent_ids[idx],
+                thread_message_count=len(thread),
+            )
+        else:
+            batchable.append(idx)
+
+    for start in range(0, len(batchable), _MAX_BATCH_THREADS):
+        chunk = batchable[start : start + _MAX_BATCH_THREADS]
+        for idx, result in zip(chunk, await _analyze_chunk(chunk, threads, agent_ids)):
+            results[idx] = result
+
+    return [r for r in results if r is not None]
+
+
+async def _analyze_chunk(
+    indices: list[int],
+    threads: list[list[dict]],
+    agent_ids: list[str],
+) -> list[ConversationAnalysisResult]:
+    """Run one batched Claude call over the threads at the given indices."""
+    user_parts = [f"# Conversation Threads ({len(indices)} threads)\n"]
+    for k, idx in enumerate(indices, 1):
+        agent_attr = f' agent="{agent_ids[idx]}"' if agent_ids[idx] else ""
+        user_parts.append(f'<thread index="{k}"{agent_attr}>')
+        user_parts.extend(_format_messages(threads[idx]))
+        user_parts.append("</thread>\n")
+    user_parts.append(
+        "\nAnalyze each thread independently. Return a JSON array with one "
+        "result object per thread, in thread order, each using the response "
+        "format above."
+    )
+    user_prompt = "\n".join(user_parts)
+
+    raw = await call_claude(_CONVERSATION_SYSTEM_PROMPT, user_prompt, "standard")
+
+    text = _FENCE_RE.sub("", raw.strip()).strip()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        data = None
+
+    if isinstance(data, list) and len(data) == len(indices):
+        return [
+            _result_from_data(
+                item if isinstance(item, dict) else {},
+                agent_ids[idx],
+                len(threads[idx]),
+            )
+            for item, idx in zip(data, indices)
+        ]
+
+    logger.warning(
+        "Batched conversation analysis returned %s results for %s threads, "
+        "falling back to per-thread calls",
+        len(data) if isinstance(data, list) else "unparseable",
+        len(indices),
+    )
+    return list(
+        await asyncio.gather(
+            *(
+                analyze_conversation(threads[idx], agent_id=agent_ids[idx])
+                for idx in indices
+            )
+        )
+    )
+
+
 def _parse_response(
     raw: str,
     agent_id: str,
@@ -163,14 +284,7 @@ def _parse_response(
 ) -> ConversationAnalysisResult:
     """Parse Claude's JSON response into a ConversationAnalysisResult."""
     # Strip markdown fences if present
-    text = raw.strip()
-    if text.startswith("```"):
-        # Remove opening fence (```json or ```)
-        first_newline = text.index("\n")
-        text = text[first_newline + 1 :]
-    if text.endswith("```"):
-        text = text[:-3]
-    text = text.strip()
+    text = _FENCE_RE.sub("", raw.strip()).strip()
 
     try:
         data = json.loads(text)
@@ -182,6 +296,15 @@ def _parse_response(
             summary="Analysis completed but response could not be parsed.",
         )
 
+    return _result_from_data(data, agent_id, message_count)
+
+
+def _result_from_data(
+    data: dict,
+    agent_id: str,
+    message_count: int,
+) -> ConversationAnalysisResult:
+    """Build a ConversationAnalysisResult from one parsed response object."""
     indicators = []
     for ind in data.get("conversation_indicators", []):
         try:
@@ -192,7 +315,8 @@ def _parse_response(
                     trait=ind.get("trait", ""),
                     confidence=float(ind.get("confidence", 0.0)),
                     evidence=ind.get("evidence", ""),
-                    message_indices=ind.get("message_indices", []),
+                    # "or []" also covers an explicit null from the model
+                    message_indices=ind.get("message_indices") or [],
                 )
             )
         except (ValueError, TypeError):
@@ -13,9 +13,10 @@ Research basis:
 from __future__ import annotations
 
 import logging
-import statistics
+from bisect import bisect_right
 from collections import Counter
 from datetime import datetime
+from math import sqrt
 
 from ethos_academy.shared.models import (
     ActivityPattern,
@@ -58,21 +59,38 @@ HUMAN_SCORE_THRESHOLD = 0.3
 
 
 def parse_timestamps(raw: list[str]) -> list[datetime]:
-    """Parse ISO 8601 timestamps, skipping invalid ones. Sorted ascending."""
-    parsed = []
-    for ts in raw:
-        try:
-            parsed.append(datetime.fromisoformat(ts))
-        except (ValueError, TypeError):
-            logger.warning("Skipping invalid timestamp: %s", ts)
+    """Parse ISO 8601 timestamps, skipping invalid ones. Sorted ascending.
+
+    Clean input parses in one comprehension. The per-element try/except
+    only runs when something in the batch fails to parse.
+    """
+    try:
+        parsed = [datetime.fromisoformat(ts) for ts in raw]
+    except (ValueError, TypeError):
+        parsed = []
+        for ts in raw:
+            try:
+                parsed.append(datetime.fromisoformat(ts))
+            except (ValueError, TypeError):
+                logger.warning("Skipping invalid timestamp: %s", ts)
     parsed.sort()
     return parsed
 
 
+def timestamps_to_seconds(parsed: list[datetime]) -> list[float]:
+    """Convert parsed datetimes to epoch seconds once, for sharing.
+
+    Interval math over floats skips a timedelta allocation per pair, and
+    one conversion serves both the temporal and burst analyzers.
+    """
+    return [dt.timestamp() for dt in parsed]
+
+
 def analyze_temporal_signature(
     timestamps: list[str],
     *,
     _parsed: list[datetime] | None = None,
+    _seconds: list[float] | None = None,
 ) -> TemporalSignature:
     """Compute coefficient of variation of inter-post intervals.
 
@@ -86,17 +104,26 @@ def analyze_temporal_signature(
     if len(parsed) < MIN_TEMPORAL_TIMESTAMPS:
         return TemporalSignature()
 
-    intervals = [
-        (parsed[i + 1] - parsed[i]).total_seconds() for i in range(len(parsed) - 1)
-    ]
+    seconds = _seconds if _seconds is not None else timestamps_to_seconds(parsed)
+
+    # One-pass Welford over the intervals: running mean and variance
+    # without materializing an intervals list or re-walking it
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(len(seconds) - 1):
+        dt = seconds[i + 1] - seconds[i]
+        n += 1
+        delta = dt - mean
+        mean += delta / n
+        m2 += delta * (dt - mean)
 
-    mean = statistics.mean(intervals)
     if mean == 0:
         return TemporalSignature(
             cv_score=0.0, mean_interval_seconds=0.0, classification="autonomous"
         )
 
-    std = statistics.pstdev(intervals)
+    std = sqrt(m2 / n)
     cv = std / mean
 
     # Normalize CV to 0-1 score: lower CV = higher autonomy score
@@ -120,6 +147,7 @@ def analyze_burst_rate(
     timestamps: list[str],
     *,
     _parsed: list[datetime] | None = None,
+    _seconds: list[float] | None = None,
 ) -> BurstAnalysis:
     """Compute percentage of consecutive posts within BURST_WINDOW_SECONDS.
 
@@ -133,12 +161,13 @@ def analyze_burst_rate(
     if len(parsed) < MIN_BURST_TIMESTAMPS:
         return BurstAnalysis(burst_rate=0.0, classification="organic")
 
+    seconds = _seconds if _seconds is not None else timestamps_to_seconds(parsed)
     burst_count = sum(
         1
-        for i in range(len(parsed) - 1)
-        if (parsed[i + 1] - parsed[i]).total_seconds() <= BURST_WINDOW_SECONDS
+        for i in range(len(seconds) - 1)
+        if seconds[i + 1] - seconds[i] <= BURST_WINDOW_SECONDS
     )
-    total_pairs = len(parsed) - 1
+    total_pairs = len(seconds) - 1
     rate = burst_count / total_pairs
 
     if rate > BURST_BOT_THRESHOLD:
@@ -171,21 +200,15 @@ def analyze_activity_pattern(
     hour_counts = Counter(dt.hour for dt in parsed)
     active_hours = sum(1 for h in range(24) if hour_counts.get(h, 0) > 0)
 
-    # Check for sleep gap: >= SLEEP_GAP_HOURS consecutive zero-activity hours
+    # Check for sleep gap: >= SLEEP_GAP_HOURS consecutive zero-activity hours.
+    # Doubling the 24-hour mask handles wrap around midnight in one pass.
     has_sleep_gap = False
-    # Use circular check (wrap around midnight)
-    for start in range(24):
-        gap = 0
-        for offset in range(24):
-            hour = (start + offset) % 24
-            if hour_counts.get(hour, 0) == 0:
-                gap += 1
-                if gap >= SLEEP_GAP_HOURS:
-                    has_sleep_gap = True
-                    break
-            else:
-                gap = 0
-        if has_sleep_gap:
+    zero_hours = [hour_counts.get(h, 0) == 0 for h in range(24)]
+    run = 0
+    for is_zero in zero_hours + zero_hours:
+        run = run + 1 if is_zero else 0
+        if run >= SLEEP_GAP_HOURS:
+            has_sleep_gap = True
             break
 
     if has_sleep_gap:
@@ -202,6 +225,27 @@ def analyze_activity_pattern(
     )
 
 
+def analyze_all(
+    timestamps: list[str], profile: dict, agent_name: str = ""
+) -> AuthenticityResult:
+    """Fused analysis path: parse once, run all four analyzers, combine.
+
+    The standalone analyze_* functions each parse on their own when
+    called directly; this entry point shares one parsed list and one
+    epoch-seconds array across them.
+    """
+    parsed = parse_timestamps(timestamps)
+    seconds = timestamps_to_seconds(parsed)
+    return compute_authenticity(
+        analyze_temporal_signature(timestamps, _parsed=parsed, _seconds=seconds),
+        analyze_burst_rate(timestamps, _parsed=parsed, _seconds=seconds),
+        analyze_activity_pattern(timestamps, _parsed=parsed),
+        analyze_identity_signals(profile),
+        len(timestamps),
+        agent_name=agent_name,
+    )
+
+
 def analyze_identity_signals(profile: dict) -> IdentitySignals:
     """Extract identity signals from a Moltbook agent profile dict.
 
@@ -229,24 +273,24 @@ def analyze_identity_signals(profile: dict) -> IdentitySignals:
     )
 
 
-def _classification_to_score(classification: str) -> float:
-    """Convert sub-classification to numeric score.
+# Sub-classification scores: 1.0 = more autonomous, 0.0 = more human,
+# 0.5 = indeterminate (also the default for unknown classifications)
+_CLASS_SCORE: dict[str, float] = {
+    "autonomous": 1.0,
+    "organic": 1.0,
+    "always_on": 1.0,
+    "human_influenced": 0.0,
+    "human_schedule": 0.0,
+    "indeterminate": 0.5,
+    "mixed": 0.5,
+    "automated": 0.5,
+    "burst_bot": 0.5,
+}
 
-    Autonomous/organic/always_on → 1.0 (more autonomous)
-    Human-influenced/human_schedule → 0.0 (more human)
-    Indeterminate/mixed/automated/burst_bot → 0.5
-    """
-    high = {"autonomous", "organic", "always_on"}
-    low = {"human_influenced", "human_schedule"}
-    mid = {"indeterminate", "mixed", "automated", "burst_bot"}
 
-    if classification in high:
-        return 1.0
-    if classification in low:
-        return 0.0
-    if classification in mid:
-        return 0.5
-    return 0.5
+def _classification_to_score(classification: str) -> float:
+    """Convert sub-classification to numeric score via _CLASS_SCORE."""
+    return _CLASS_SCORE.get(classification, 0.5)
 
 
 def _identity_score(identity: IdentitySignals) -> float:
@@ -258,15 +302,14 @@ def _identity_score(identity: IdentitySignals) -> float:
     return 1.0
 
 
+# Confidence tiers by data volume: < 5 → 0.1, < 20 → 0.5, < 50 → 0.7, else 0.9
+_CONF_THRESHOLDS = (5, 20, 50)
+_CONF_SCORES = (0.1, 0.5, 0.7, 0.9)
+
+
 def _confidence_from_count(num_timestamps: int) -> float:
     """Compute confidence based on data volume."""
-    if num_timestamps >= 50:
-        return 0.9
-    if num_timestamps >= 20:
-        return 0.7
-    if num_timestamps >= 5:
-        return 0.5
-    return 0.1
+    return _CONF_SCORES[bisect_right(_CONF_THRESHOLDS, num_timestamps)]
 
 
 def compute_authenticity(
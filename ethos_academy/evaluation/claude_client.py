@@ -18,9 +18,13 @@ Prompt caching: Static system prompts use cache_control for 90% input cost reduc
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import os
 import re
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from functools import lru_cache
 
 import anthropic
 
@@ -39,6 +43,7 @@ _DEFAULT_OPUS_MODEL = "claude-opus-4-6"
 
 # Tool names we expect Claude to call, in order.
 _EXPECTED_TOOLS = ("identify_intent", "detect_indicators", "score_traits")
+_EXPECTED_TOOLS_SET = frozenset(_EXPECTED_TOOLS)
 
 # Extraction system prompt for Call 2 (Think-then-Extract)
 _EXTRACT_SYSTEM = (
@@ -54,6 +59,46 @@ _KEY_PATTERN = re.compile(
 )
 
 
+# Content-addressed response cache. ETHOS_CACHE_MODE controls behavior:
+#   enabled    read and write
+#   read_only  serve hits, never store
+#   write_only store results, never serve
+#   replay     serve hits, raise on miss (no API spend)
+#   disabled   default, cache is bypassed entirely
+_CACHE_MODES = ("enabled", "read_only", "write_only", "replay", "disabled")
+_response_cache: dict[str, str] = {}
+_tool_cache: dict[str, tuple[dict[str, dict], str]] = {}
+
+
+def _cache_mode() -> str:
+    """Current cache mode from ETHOS_CACHE_MODE. Unknown values disable."""
+    mode = os.environ.get("ETHOS_CACHE_MODE", "disabled").strip().lower()
+    return mode if mode in _CACHE_MODES else "disabled"
+
+
+@lru_cache(maxsize=32)
+def _system_digest(system_prompt: str) -> str:
+    """Encode and hash a system prompt once per distinct prompt.
+
+    System prompts are multi-KB rulebooks drawn from a handful of static
+    templates; memoizing the digest avoids re-encoding and re-hashing
+    the same text on every cached call.
+    """
+    return hashlib.sha256(system_prompt.encode()).hexdigest()
+
+
+def _cache_key(model: str, system_prompt: str, user_prompt: str, extra: str) -> str:
+    """Content-addressed key over everything that shapes the response."""
+    payload = f"{model}|{_system_digest(system_prompt)}|{user_prompt}|{extra}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def clear_response_cache() -> None:
+    """Empty both response caches. For tests."""
+    _response_cache.clear()
+    _tool_cache.clear()
+
+
 def _resolve_api_key() -> str:
     """Return the Anthropic API key for the current request.
 
@@ -66,26 +111,35 @@ def _resolve_api_key() -> str:
     return EthosConfig.from_env().anthropic_api_key
 
 
-# Shared client for the server API key. BYOK requests get their own client.
-_shared_client: anthropic.AsyncAnthropic | None = None
-_shared_client_key: str | None = None
+# One client per API key, LRU-bounded. Reusing clients keeps HTTPS
+# connections alive, so repeat calls skip the TCP and TLS handshakes.
+# Covers the server key and the small set of BYOK keys active at once.
+_MAX_CLIENTS = 8
+_clients: OrderedDict[str, anthropic.AsyncAnthropic] = OrderedDict()
 
 
 def _get_client() -> anthropic.AsyncAnthropic:
-    """Return a reusable AsyncAnthropic client.
-
-    Reuses a shared singleton for the server key. BYOK overrides create
-    a fresh client (short-lived, per-request).
-    """
-    global _shared_client, _shared_client_key
+    """Return a reusable AsyncAnthropic client for the current request's key."""
     api_key = _resolve_api_key()
-    byok = anthropic_api_key_var.get()
-    if byok is not None:
-        return anthropic.AsyncAnthropic(api_key=api_key, max_retries=2)
-    if _shared_client is None or _shared_client_key != api_key:
-        _shared_client = anthropic.AsyncAnthropic(api_key=api_key, max_retries=2)
-        _shared_client_key = api_key
-    return _shared_client
+    client = _clients.get(api_key)
+    if client is None:
+        client = anthropic.AsyncAnthropic(api_key=api_key, max_retries=2)
+        _clients[api_key] = client
+        while len(_clients) > _MAX_CLIENTS:
+            _clients.popitem(last=False)
+    else:
+        _clients.move_to_end(api_key)
+    return client
+
+
+async def close_clients() -> None:
+    """Close every cached client's connection pool. Called from app shutdown."""
+    for client in _clients.values():
+        try:
+            await client.close()
+        except Exception:
+            logger.debug("Client close failed", exc_info=True)
+    _clients.clear()
 
 
 def _redact(msg: str) -> str:
@@ -120,11 +174,14 @@ def _get_thinking_config(model: str) -> dict | None:
     return None
 
 
+@lru_cache(maxsize=32)
 def _cacheable_system(system_prompt: str) -> list[dict]:
     """Convert a system prompt string to a cacheable content block array.
 
     The indicator catalog and constitutional values are static across calls.
     Caching skips re-tokenizing the same rulebook on repeated evaluations.
+    Memoized so the handful of static prompts (evaluation, conversation,
+    extract) reuse one block list instead of rebuilding it per request.
     """
     return [
         {
@@ -135,6 +192,17 @@ def _cacheable_system(system_prompt: str) -> list[dict]:
     ]
 
 
+def _log_cache_usage(response) -> None:
+    """Log prompt-cache hit/creation counters to verify caching works."""
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        logger.debug(
+            "Prompt cache: read=%s created=%s",
+            getattr(usage, "cache_read_input_tokens", 0),
+            getattr(usage, "cache_creation_input_tokens", 0),
+        )
+
+
 async def _call_think_then_extract(
     client: anthropic.AsyncAnthropic,
     model: str,
@@ -230,13 +298,17 @@ async def _call_think_then_extract(
                 tool_results[block.name] = block.input
                 tool_use_blocks.append(block)
 
-        if all(name in tool_results for name in _EXPECTED_TOOLS):
+        if _EXPECTED_TOOLS_SET.issubset(tool_results):
             break
 
         if not tool_use_blocks:
             logger.warning("Extract returned no tool calls on turn %d", turn)
             break
 
+        # Terminal turn: skip building tool results Claude will never see
+        if extract_response.stop_reason == "end_turn":
+            break
+
         extract_messages.append(
             {"role": "assistant", "content": extract_response.content}
         )
@@ -254,10 +326,7 @@ async def _call_think_then_extract(
             }
         )
 
-        if extract_response.stop_reason == "end_turn":
-            break
-
-    missing = [name for name in _EXPECTED_TOOLS if name not in tool_results]
+    missing = _EXPECTED_TOOLS_SET - tool_results.keys()
     if missing:
         logger.warning("Missing tool calls after extract: %s", missing)
 
@@ -283,11 +352,23 @@ async def call_claude(system_prompt: str, user_prompt: str, tier: str) -> str:
         EvaluationError: If the Anthropic API call fails.
     """
     model = _get_model(tier)
-    client = _get_client()
 
     # Deep tiers (daily reports) produce large structured JSON responses
     max_tokens = 4096 if tier in ("deep", "deep_with_context") else 2048
 
+    mode = _cache_mode()
+    cache_key = ""
+    if mode != "disabled":
+        cache_key = _cache_key(model, system_prompt, user_prompt, str(max_tokens))
+        if mode in ("enabled", "read_only", "replay"):
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            if mode == "replay":
+                raise EvaluationError("Response cache miss in replay mode")
+
+    client = _get_client()
+
     call_kwargs: dict = {
         "model": model,
         "max_tokens": max_tokens,
@@ -311,6 +392,8 @@ async def call_claude(system_prompt: str, user_prompt: str, tier: str) -> str:
     except Exception as exc:
         raise EvaluationError(f"Claude API call failed: {_redact(str(exc))}") from None
 
+    _log_cache_usage(response)
+
     # Extract text blocks (skip thinking blocks)
     text_parts = []
     for block in response.content:
@@ -319,7 +402,55 @@ async def call_claude(system_prompt: str, user_prompt: str, tier: str) -> str:
         elif block.type == "text":
             text_parts.append(block.text)
 
-    return "".join(text_parts)
+    text = "".join(text_parts)
+    if mode in ("enabled", "write_only"):
+        _response_cache[cache_key] = text
+    return text
+
+
+async def call_claude_streaming(
+    system_prompt: str, user_prompt: str, tier: str
+) -> AsyncIterator[str]:
+    """Stream Claude's response text as it generates.
+
+    Deep-tier responses run to thousands of tokens; streaming lets the
+    consumer process early sections while Claude is still generating,
+    instead of blocking on the full completion.
+
+    Yields:
+        Text chunks in generation order.
+
+    Raises:
+        ConfigError: If the Anthropic API key is invalid.
+        EvaluationError: If the Anthropic API call fails.
+    """
+    model = _get_model(tier)
+    client = _get_client()
+
+    max_tokens = 4096 if tier in ("deep", "deep_with_context") else 2048
+
+    call_kwargs: dict = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "system": _cacheable_system(system_prompt),
+        "messages": [{"role": "user", "content": user_prompt}],
+    }
+
+    thinking_config = _get_thinking_config(model)
+    if thinking_config:
+        call_kwargs["thinking"] = thinking_config
+        call_kwargs["max_tokens"] = max(max_tokens, 8192)
+
+    try:
+        async with client.messages.stream(**call_kwargs) as stream:
+            async for text in stream.text_stream:
+                yield text
+    except anthropic.AuthenticationError:
+        raise ConfigError("Invalid Anthropic API key") from None
+    except EvaluationError:
+        raise
+    except Exception as exc:
+        raise EvaluationError(f"Claude API call failed: {_redact(str(exc))}") from None
 
 
 async def call_claude_with_tools(
@@ -352,6 +483,18 @@ async def call_claude_with_tools(
         EvaluationError: If the API call fails or tools are incomplete.
     """
     model = _get_model(tier)
+
+    mode = _cache_mode()
+    cache_key = ""
+    if mode != "disabled":
+        cache_key = _cache_key(model, system_prompt, user_prompt, tier)
+        if mode in ("enabled", "read_only", "replay"):
+            cached = _tool_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            if mode == "replay":
+                raise EvaluationError("Tool cache miss in replay mode")
+
     client = _get_client()
 
     # Think-then-Extract only for deep tiers where reasoning depth matters.
@@ -364,6 +507,8 @@ async def call_claude_with_tools(
                 client, model, system_prompt, user_prompt, tier, tools, thinking_config
             )
             if result is not None:
+                if mode in ("enabled", "write_only"):
+                    _tool_cache[cache_key] = result
                 return result
 
     # Fallback: single-call path (original behavior + prompt caching)
@@ -397,13 +542,17 @@ async def call_claude_with_tools(
                 tool_results[block.name] = block.input
                 tool_use_blocks.append(block)
 
-        if all(name in tool_results for name in _EXPECTED_TOOLS):
+        if _EXPECTED_TOOLS_SET.issubset(tool_results):
             break
 
         if not tool_use_blocks:
             logger.warning("Claude returned no tool calls on turn %d", turn)
             break
 
+        # Terminal turn: skip building tool results Claude will never see
+        if response.stop_reason == "end_turn":
+            break
+
         messages.append({"role": "assistant", "content": response.content})
         tool_result_content = [
             {
@@ -415,11 +564,10 @@ async def call_claude_with_tools(
         ]
         messages.append({"role": "user", "content": tool_result_content})
 
-        if response.stop_reason == "end_turn":
-            break
-
-    missing = [name for name in _EXPECTED_TOOLS if name not in tool_results]
+    missing = _EXPECTED_TOOLS_SET - tool_results.keys()
     if missing:
         logger.warning("Missing tool calls: %s", missing)
 
+    if mode in ("enabled", "write_only") and not missing:
+        _tool_cache[cache_key] = (tool_results, "")
     return tool_results, ""
@@ -1,12 +1,24 @@
 """Backward compatibility — scanner renamed to instinct.
 
-All imports from ethos_academy.evaluation.scanner still work.
-New code should import from ethos_academy.evaluation.instinct.
+All imports from ethos_academy.evaluation.scanner still work, but the
+forwarding is lazy (PEP 562): importing this module no longer loads
+instinct or the shared models. New code should import from
+ethos_academy.evaluation.instinct directly.
 """
 
-from ethos_academy.evaluation.instinct import (  # noqa: F401
-    KEYWORD_LEXICON,
-    scan,
-    scan_keywords,
-)
-from ethos_academy.shared.models import InstinctResult as KeywordScanResult  # noqa: F401
+from __future__ import annotations
+
+__all__ = ["KEYWORD_LEXICON", "scan", "scan_keywords", "KeywordScanResult"]
+
+
+def __getattr__(name: str):
+    """Forward attribute access to instinct on first use."""
+    if name == "KeywordScanResult":
+        from ethos_academy.shared.models import InstinctResult
+
+        return InstinctResult
+    if name in ("KEYWORD_LEXICON", "scan", "scan_keywords"):
+        from ethos_academy.evaluation import instinct
+
+        return getattr(instinct, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
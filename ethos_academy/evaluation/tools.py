@@ -10,6 +10,69 @@ Claude calls all three in order within a single evaluation turn.
 
 from __future__ import annotations
 
+import json
+
+from ethos_academy.taxonomy.traits import TRAITS
+
+# One shared bounded-score schema referenced for every trait instead of
+# 13 hand-written copies. Keeps the trait list in sync with the taxonomy.
+_SCORE: dict = {"type": "number", "minimum": 0.0, "maximum": 1.0}
+
+# Enum value sets lifted out of the schemas so tests and callers can
+# introspect them without duplicating the literals.
+_RHETORICAL_MODES = (
+    "narrative",
+    "persuasive",
+    "informational",
+    "technical",
+    "conversational",
+    "satirical",
+    "humorous",
+    "exploratory",
+    "creative",
+    "instructional",
+    "emotional_appeal",
+)
+_PRIMARY_INTENTS = (
+    "reflect",
+    "educate",
+    "persuade",
+    "recruit",
+    "sell",
+    "entertain",
+    "explore",
+    "create",
+    "validate",
+    "warn",
+    "request",
+    "inform",
+    "manipulate",
+    "deceive",
+)
+_COST_TO_READER = (
+    "none",
+    "financial",
+    "time",
+    "trust",
+    "autonomy",
+    "privacy",
+    "emotional",
+    "multiple",
+)
+_STAKES_REALITY = (
+    "real",
+    "metaphorical",
+    "exaggerated",
+    "fabricated",
+    "fictional",
+    "mixed",
+)
+_PROPORTIONALITY = ("proportional", "disproportionate", "understated")
+_PERSONA_TYPES = ("real_identity", "fictional_character", "brand_mascot", "unclear")
+_RELATIONAL_QUALITIES = ("present", "performative", "transactional", "absent")
+_CLAIM_TYPES = ("factual", "experiential", "opinion", "metaphorical", "fictional")
+_TRUST_LEVELS = ("trustworthy", "mixed", "untrustworthy")
+
 EVALUATION_TOOLS: list[dict] = [
     {
         "name": "identify_intent",
@@ -23,19 +86,7 @@ EVALUATION_TOOLS: list[dict] = [
             "properties": {
                 "rhetorical_mode": {
                     "type": "string",
-                    "enum": [
-                        "narrative",
-                        "persuasive",
-                        "informational",
-                        "technical",
-                        "conversational",
-                        "satirical",
-                        "humorous",
-                        "exploratory",
-                        "creative",
-                        "instructional",
-                        "emotional_appeal",
-                    ],
+                    "enum": list(_RHETORICAL_MODES),
                     "description": (
                         "How the message communicates its content. "
                         "'exploratory' = curiosity, wondering, questioning, "
@@ -46,22 +97,7 @@ EVALUATION_TOOLS: list[dict] = [
                 },
                 "primary_intent": {
                     "type": "string",
-                    "enum": [
-                        "reflect",
-                        "educate",
-                        "persuade",
-                        "recruit",
-                        "sell",
-                        "entertain",
-                        "explore",
-                        "create",
-                        "validate",
-                        "warn",
-                        "request",
-                        "inform",
-                        "manipulate",
-                        "deceive",
-                    ],
+                    "enum": list(_PRIMARY_INTENTS),
                     "description": (
                         "The message's primary communicative goal. "
                         "'explore' = curiosity-driven inquiry, speculation, "
@@ -82,28 +118,12 @@ EVALUATION_TOOLS: list[dict] = [
                 },
                 "cost_to_reader": {
                     "type": "string",
-                    "enum": [
-                        "none",
-                        "financial",
-                        "time",
-                        "trust",
-                        "autonomy",
-                        "privacy",
-                        "emotional",
-                        "multiple",
-                    ],
+                    "enum": list(_COST_TO_READER),
                     "description": "What it costs the reader to comply",
                 },
                 "stakes_reality": {
                     "type": "string",
-                    "enum": [
-                        "real",
-                        "metaphorical",
-                        "exaggerated",
-                        "fabricated",
-                        "fictional",
-                        "mixed",
-                    ],
+                    "enum": list(_STAKES_REALITY),
                     "description": (
                         "Whether the stakes or urgency described "
                         "are real, manufactured, or part of a fictional narrative. "
@@ -113,19 +133,14 @@ EVALUATION_TOOLS: list[dict] = [
                 },
                 "proportionality": {
                     "type": "string",
-                    "enum": ["proportional", "disproportionate", "understated"],
+                    "enum": list(_PROPORTIONALITY),
                     "description": (
                         "Whether the rhetorical intensity matches the actual stakes"
                     ),
                 },
                 "persona_type": {
                     "type": "string",
-                    "enum": [
-                        "real_identity",
-                        "fictional_character",
-                        "brand_mascot",
-                        "unclear",
-                    ],
+                    "enum": list(_PERSONA_TYPES),
                     "description": (
                         "Whether the speaker presents as a real entity, "
                         "a fictional character or persona, a brand mascot, "
@@ -135,12 +150,7 @@ EVALUATION_TOOLS: list[dict] = [
                 },
                 "relational_quality": {
                     "type": "string",
-                    "enum": [
-                        "present",
-                        "performative",
-                        "transactional",
-                        "absent",
-                    ],
+                    "enum": list(_RELATIONAL_QUALITIES),
                     "description": (
                         "Quality of engagement with the other party. "
                         "'present' = genuine engagement, stays with the other's "
@@ -162,13 +172,7 @@ EVALUATION_TOOLS: list[dict] = [
                             },
                             "type": {
                                 "type": "string",
-                                "enum": [
-                                    "factual",
-                                    "experiential",
-                                    "opinion",
-                                    "metaphorical",
-                                    "fictional",
-                                ],
+                                "enum": list(_CLAIM_TYPES),
                                 "description": (
                                     "Whether this is a verifiable fact, "
                                     "personal experience, opinion, "
@@ -273,88 +277,8 @@ EVALUATION_TOOLS: list[dict] = [
             "properties": {
                 "trait_scores": {
                     "type": "object",
-                    "properties": {
-                        "virtue": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "goodwill": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "justice": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "manipulation": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "deception": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "accuracy": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "reasoning": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "fabrication": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "broken_logic": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "recognition": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "compassion": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "dismissal": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                        "exploitation": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                        },
-                    },
-                    "required": [
-                        "virtue",
-                        "goodwill",
-                        "justice",
-                        "manipulation",
-                        "deception",
-                        "accuracy",
-                        "reasoning",
-                        "fabrication",
-                        "broken_logic",
-                        "recognition",
-                        "compassion",
-                        "dismissal",
-                        "exploitation",
-                    ],
+                    "properties": {trait: _SCORE for trait in TRAITS},
+                    "required": list(TRAITS),
                     "description": (
                         "Scores for all 13 traits (0.0-1.0). "
                         "Positive traits: higher=better. "
@@ -363,7 +287,7 @@ EVALUATION_TOOLS: list[dict] = [
                 },
                 "overall_trust": {
                     "type": "string",
-                    "enum": ["trustworthy", "mixed", "untrustworthy"],
+                    "enum": list(_TRUST_LEVELS),
                     "description": "Overall trust assessment",
                 },
                 "confidence": {
@@ -393,3 +317,21 @@ EVALUATION_TOOLS: list[dict] = [
         },
     },
 ]
+
+
+# Tool schemas serialized once at import. The schemas never change at
+# runtime, so callers that send raw JSON payloads reuse these bytes
+# instead of re-serializing the 400-line structure per request.
+#
+# The Anthropic SDK path in claude_client keeps taking the typed list:
+# the SDK owns request serialization and exposes no supported way to
+# splice pre-encoded bytes into the body. Patching its HTTP layer would
+# break on SDK upgrades, so the bytes stay an opt-in for raw transports.
+EVALUATION_TOOLS_JSON: bytes = json.dumps(
+    EVALUATION_TOOLS, separators=(",", ":")
+).encode()
+
+
+def get_tools_payload() -> bytes:
+    """Return the tool definitions as pre-serialized compact JSON bytes."""
+    return EVALUATION_TOOLS_JSON
@@ -9,6 +9,7 @@ graph_context() is the public API. close_shared_service() for shutdown hooks.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -70,6 +71,28 @@ class GraphService:
             logger.warning("Neo4j query failed: %s", exc)
             return ([], None, None)
 
+    async def stream_query(
+        self,
+        query: str,
+        parameters: dict | None = None,
+    ):
+        """Stream records from a Cypher query one at a time.
+
+        Yields records as the driver fetches them instead of
+        materializing the full result set, so callers can process
+        large results at constant memory. Yields nothing if Neo4j is
+        unavailable or the query fails mid-stream.
+        """
+        if self._driver is None:
+            return
+        try:
+            async with self._driver.session() as session:
+                result = await session.run(query, parameters or {})
+                async for record in result:
+                    yield record
+        except Exception as exc:
+            logger.warning("Neo4j streaming query failed: %s", exc)
+
     @property
     def connected(self) -> bool:
         return self._driver is not None
@@ -78,14 +101,23 @@ class GraphService:
 # ── Shared singleton for connection pooling ─────────────────────────
 
 _shared_service: GraphService | None = None
+_shared_service_lock = asyncio.Lock()
 
 
 async def get_shared_service() -> GraphService:
-    """Return a shared GraphService, connecting lazily on first call."""
+    """Return a shared GraphService, connecting lazily on first call.
+
+    The lock keeps concurrent first callers from each opening their own
+    driver; only one connect runs, the rest reuse it.
+    """
     global _shared_service
-    if _shared_service is None or not _shared_service.connected:
-        _shared_service = GraphService()
-        await _shared_service.connect()
+    if _shared_service is not None and _shared_service.connected:
+        return _shared_service
+    async with _shared_service_lock:
+        if _shared_service is None or not _shared_service.connected:
+            service = GraphService()
+            await service.connect()
+            _shared_service = service
     return _shared_service
 
 
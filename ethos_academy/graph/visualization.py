@@ -235,11 +235,24 @@ async def get_episodic_layer(service: GraphService) -> dict:
 
     try:
         records, _, _ = await service.execute_query(_AGENTS_AND_EVALUATIONS_QUERY)
+
+        # Persistent seen-sets: rebuilding a dedup set per record made
+        # the rel passes quadratic in evaluation count.
+        seen_evaluated: set[tuple[str, str]] = set()
+        seen_detected: set[tuple[str, str]] = set()
+
+        # Local aliases keep the per-record loop from re-resolving the
+        # same result subscripts and append methods on every row.
+        agents = result["agents"]
+        evaluations = result["evaluations"]
+        evaluated_append = result["evaluated_rels"].append
+        detected_append = result["detected_rels"].append
+
         for rec in records:
             agent_id = rec.get("agent_id", "")
-            if agent_id and agent_id not in result["agents"]:
-                # Determine alignment from latest eval
-                result["agents"][agent_id] = {
+            agent = agents.get(agent_id) if agent_id else None
+            if agent_id and agent is None:
+                agent = agents[agent_id] = {
                     "agent_id": agent_id,
                     "agent_name": rec.get("agent_name"),
                     "evaluation_count": rec.get("agent_eval_count", 0),
@@ -247,10 +260,16 @@ async def get_episodic_layer(service: GraphService) -> dict:
                     "phronesis_trend": rec.get("agent_trend", "insufficient_data"),
                 }
 
+            # Alignment comes from the agent's first (most recent) eval row
+            if agent is not None and "alignment_status" not in agent:
+                alignment = rec.get("eval_alignment")
+                if alignment:
+                    agent["alignment_status"] = alignment
+
             eval_id = rec.get("eval_id", "")
             if eval_id:
-                if eval_id not in result["evaluations"]:
-                    result["evaluations"][eval_id] = {
+                if eval_id not in evaluations:
+                    evaluations[eval_id] = {
                         "evaluation_id": eval_id,
                         "ethos": rec.get("eval_ethos", 0.0),
                         "logos": rec.get("eval_logos", 0.0),
@@ -263,10 +282,9 @@ async def get_episodic_layer(service: GraphService) -> dict:
 
                 # Agent → Evaluation rel (deduplicate)
                 rel_key = (agent_id, eval_id)
-                if rel_key not in {
-                    (r["agent"], r["evaluation"]) for r in result["evaluated_rels"]
-                }:
-                    result["evaluated_rels"].append(
+                if rel_key not in seen_evaluated:
+                    seen_evaluated.add(rel_key)
+                    evaluated_append(
                         {
                             "agent": agent_id,
                             "evaluation": eval_id,
@@ -277,11 +295,9 @@ async def get_episodic_layer(service: GraphService) -> dict:
                 indicator_id = rec.get("detected_indicator_id")
                 if indicator_id:
                     det_key = (eval_id, indicator_id)
-                    if det_key not in {
-                        (r["evaluation"], r["indicator"])
-                        for r in result["detected_rels"]
-                    }:
-                        result["detected_rels"].append(
+                    if det_key not in seen_detected:
+                        seen_detected.add(det_key)
+                        detected_append(
                             {
                                 "evaluation": eval_id,
                                 "indicator": indicator_id,
@@ -289,16 +305,8 @@ async def get_episodic_layer(service: GraphService) -> dict:
                             }
                         )
 
-        # Update agents with alignment_status from their most recent eval
-        for rec in records:
-            agent_id = rec.get("agent_id", "")
-            if agent_id and agent_id in result["agents"]:
-                alignment = rec.get("eval_alignment")
-                if alignment and "alignment_status" not in result["agents"][agent_id]:
-                    result["agents"][agent_id]["alignment_status"] = alignment
-
         # Set alignment_status default for agents that didn't get one
-        for agent in result["agents"].values():
+        for agent in agents.values():
             if "alignment_status" not in agent:
                 agent["alignment_status"] = "unknown"
 
@@ -509,6 +517,7 @@ async def get_indicator_backbone(service: GraphService) -> dict:
 
     try:
         records, _, _ = await service.execute_query(_DETECTED_INDICATORS_BACKBONE_QUERY)
+        seen_rels: set[tuple[str, str]] = set()
         for rec in records:
             indicator_id = rec.get("indicator_id", "")
             if indicator_id and indicator_id not in result["indicators"]:
@@ -521,9 +530,8 @@ async def get_indicator_backbone(service: GraphService) -> dict:
             trait_name = rec.get("trait_name", "")
             if indicator_id and trait_name:
                 rel_key = (indicator_id, trait_name)
-                if rel_key not in {
-                    (r["indicator"], r["trait"]) for r in result["indicator_trait_rels"]
-                }:
+                if rel_key not in seen_rels:
+                    seen_rels.add(rel_key)
                     result["indicator_trait_rels"].append(
                         {
                             "indicator": indicator_id,
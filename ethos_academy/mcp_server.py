@@ -10,6 +10,7 @@ so FastMCP returns a proper MCP error to the client.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import hmac as _hmac
@@ -24,6 +25,7 @@ from fastmcp import FastMCP
 from fastmcp.server.dependencies import get_http_headers
 from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
 from fastmcp.tools.tool import ToolResult
+from pydantic import TypeAdapter
 
 from ethos_academy.context import agent_api_key_var, anthropic_api_key_var, is_admin_var
 from ethos_academy import (
@@ -65,13 +67,14 @@ from ethos_academy.graph.enrollment import (
     get_exam_status,
     get_key_hash_and_phone_status,
 )
-from ethos_academy.graph.service import graph_context
+from ethos_academy.graph.service import close_shared_service, graph_context
 from ethos_academy.phone_service import (
     submit_phone as _submit_phone,
     verify_phone as _verify_phone,
     resend_code as _resend_code,
 )
 from ethos_academy.shared.errors import EnrollmentError, VerificationError
+from ethos_academy.shared.models import EvaluationHistoryItem
 
 logger = logging.getLogger(__name__)
 
@@ -290,6 +293,39 @@ def _rate_limit_write_tool(agent_id: str) -> None:
         _write_tool_requests.popitem(last=False)
 
 
+# ── Read-tool TTL cache ───────────────────────────────────────────
+
+# Profiles, report cards, and alumni aggregates change on the scale of
+# minutes, not seconds. A short per-process TTL absorbs rapid repeat
+# reads (a student tabbing between views) without extra Cypher
+# round-trips. Write tools invalidate their agent's entries so fresh
+# evaluations show up immediately. Cached values are model_dump() dicts,
+# so hits skip Pydantic re-serialization too.
+_READ_CACHE_TTL = 30.0
+_read_cache: dict[tuple, tuple[float, dict]] = {}
+_read_cache_lock = asyncio.Lock()
+
+
+async def _cached_read(key: tuple, loader) -> dict:
+    """Return the cached dict for key, calling loader on miss or expiry."""
+    now = time.monotonic()
+    async with _read_cache_lock:
+        entry = _read_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+    value = await loader()
+    async with _read_cache_lock:
+        _read_cache[key] = (now + _READ_CACHE_TTL, value)
+    return value
+
+
+def _invalidate_read_cache(agent_id: str) -> None:
+    """Drop cached reads for one agent plus the alumni aggregate."""
+    stale = [k for k in _read_cache if k == ("alumni",) or k[1:] == (agent_id,)]
+    for key in stale:
+        _read_cache.pop(key, None)
+
+
 _TOOL_CATALOG = {
     "getting_started": {
         "description": "New here? Start with the entrance exam.",
@@ -437,6 +473,7 @@ async def examine_message(
         agent_specialty=agent_specialty,
         message_timestamp=message_timestamp,
     )
+    _invalidate_read_cache(source)
     return result.model_dump()
 
 
@@ -465,6 +502,7 @@ async def reflect_on_message(
         agent_specialty=agent_specialty,
         message_timestamp=message_timestamp,
     )
+    _invalidate_read_cache(source)
     return result.model_dump()
 
 
@@ -491,8 +529,12 @@ async def get_character_report(agent_id: str) -> dict:
 
     Returns your grade, trends, insights, and homework assignments.
     """
-    result = await character_report(agent_id)
-    return result.model_dump()
+
+    async def _load() -> dict:
+        result = await character_report(agent_id)
+        return result.model_dump()
+
+    return await _cached_read(("report", agent_id), _load)
 
 
 @mcp.tool()
@@ -508,9 +550,15 @@ async def generate_report(agent_id: str) -> dict:
     _require_byok_on_http()
     _rate_limit_write_tool(agent_id)
     result = await generate_daily_report(agent_id)
+    _invalidate_read_cache(agent_id)
     return result.model_dump()
 
 
+# Serializes the whole history in one pydantic-core call instead of a
+# per-item model_dump loop. Matters at the 1000-item transcript cap.
+_TRANSCRIPT_ADAPTER = TypeAdapter(list[EvaluationHistoryItem])
+
+
 @mcp.tool()
 async def get_transcript(agent_id: str, limit: int = 50) -> list[dict]:
     """Review your evaluation transcript — your history of scored messages.
@@ -520,7 +568,7 @@ async def get_transcript(agent_id: str, limit: int = 50) -> list[dict]:
     """
     limit = min(limit, 1000)
     result = await get_agent_history(agent_id, limit=limit)
-    return [item.model_dump() for item in result]
+    return _TRANSCRIPT_ADAPTER.dump_python(result)
 
 
 @mcp.tool()
@@ -529,8 +577,12 @@ async def get_student_profile(agent_id: str) -> dict:
 
     Shows your dimension averages, trait averages, and phronesis trend over time.
     """
-    result = await get_agent(agent_id)
-    return result.model_dump()
+
+    async def _load() -> dict:
+        result = await get_agent(agent_id)
+        return result.model_dump()
+
+    return await _cached_read(("profile", agent_id), _load)
 
 
 @mcp.tool()
@@ -540,8 +592,12 @@ async def get_alumni_benchmarks() -> dict:
     Returns trait averages and total evaluations across all agents,
     so you can compare your scores to the cohort.
     """
-    result = await get_alumni()
-    return result.model_dump()
+
+    async def _load() -> dict:
+        result = await get_alumni()
+        return result.model_dump()
+
+    return await _cached_read(("alumni",), _load)
 
 
 @mcp.tool()
@@ -583,6 +639,80 @@ async def detect_behavioral_patterns(agent_id: str) -> dict:
     return result.model_dump()
 
 
+# ── Batch dispatch ────────────────────────────────────────────────
+
+# Tools that batch_execute may fan out. Each entry maps the public tool
+# name to the underlying handler (FunctionTool.fn). Enrollment, phone,
+# and key tools stay out: they are stateful multi-step flows where
+# ordering matters.
+_BATCHABLE_TOOLS = {
+    "examine_message": examine_message.fn,
+    "reflect_on_message": reflect_on_message.fn,
+    "get_transcript": get_transcript.fn,
+    "get_student_profile": get_student_profile.fn,
+    "get_alumni_benchmarks": get_alumni_benchmarks.fn,
+    "detect_behavioral_patterns": detect_behavioral_patterns.fn,
+    "get_character_report": get_character_report.fn,
+}
+
+_BATCH_MAX_CONCURRENT = 5
+_BATCH_MAX_CALLS = 20
+
+
+def _batch_error_envelope(tool_name: str, exc: BaseException) -> dict:
+    """Build a typed error slot for one failed batch call."""
+    logger.warning("Batched call to %s failed: %s", tool_name, exc)
+    return {
+        "tool": tool_name,
+        "error": type(exc).__name__,
+        "detail": str(exc),
+    }
+
+
+@mcp.tool()
+async def batch_execute(calls: list[dict]) -> list[dict]:
+    """Run several tool calls concurrently and return results in request order.
+
+    Each entry needs a "tool" name and an optional "args" dict, e.g.
+    [{"tool": "get_student_profile", "args": {"agent_id": "socrates"}},
+     {"tool": "get_alumni_benchmarks"}].
+
+    Supported tools: examine_message, reflect_on_message, get_transcript,
+    get_student_profile, get_alumni_benchmarks, detect_behavioral_patterns,
+    get_character_report. At most 20 calls per batch, 5 running at a time.
+
+    Each result slot holds {"tool": name, "result": ...} on success or
+    {"tool": name, "error": exception-type, "detail": message} on failure.
+    Clients branch on the error type without parsing message strings.
+    One failing call never fails the batch.
+    """
+    if len(calls) > _BATCH_MAX_CALLS:
+        raise ValueError(f"Batch too large: max {_BATCH_MAX_CALLS} calls per batch")
+
+    semaphore = asyncio.Semaphore(_BATCH_MAX_CONCURRENT)
+
+    async def _run_one(entry: dict):
+        tool_name = entry.get("tool", "")
+        fn = _BATCHABLE_TOOLS.get(tool_name)
+        if fn is None:
+            raise ValueError(
+                f"Unknown or non-batchable tool '{tool_name}'. "
+                f"Supported: {', '.join(sorted(_BATCHABLE_TOOLS))}"
+            )
+        async with semaphore:
+            return await fn(**entry.get("args", {}))
+
+    results = await asyncio.gather(
+        *(_run_one(entry) for entry in calls), return_exceptions=True
+    )
+    return [
+        _batch_error_envelope(entry.get("tool", ""), result)
+        if isinstance(result, BaseException)
+        else {"tool": entry.get("tool", ""), "result": result}
+        for entry, result in zip(calls, results)
+    ]
+
+
 @mcp.tool()
 async def take_entrance_exam(
     agent_id: str = "",
@@ -1410,6 +1540,10 @@ def main():
     except Exception:
         logger.exception("MCP server crashed")
         raise
+    finally:
+        # All tool handlers share one Neo4j driver through graph_context().
+        # Close it on the way out, mirroring the API lifespan hook.
+        asyncio.run(close_shared_service())
 
 
 if __name__ == "__main__":
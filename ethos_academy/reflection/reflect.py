@@ -7,6 +7,7 @@ Two modes:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from ethos_academy.evaluate import evaluate
@@ -48,8 +49,11 @@ async def reflect(agent_id: str, text: str | None = None) -> ReflectionResult:
                     trend="insufficient_data",
                 )
 
-            profile = await get_agent_profile(service, agent_id)
-            history = await get_evaluation_history(service, agent_id, limit=20)
+            # Independent reads; overlap the two Neo4j round-trips
+            profile, history = await asyncio.gather(
+                get_agent_profile(service, agent_id),
+                get_evaluation_history(service, agent_id, limit=20),
+            )
     except Exception as exc:
         logger.warning("Graph unavailable for reflect: %s", exc)
         return ReflectionResult(
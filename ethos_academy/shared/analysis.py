@@ -70,15 +70,16 @@ def detect_temporal_pattern(recent: list[dict]) -> str:
     if len(recent) < 2:
         return "insufficient_data"
 
-    # Average dimension score per evaluation
-    scores = []
+    # Recent evaluations are in reverse chronological order (newest first).
+    # One pass: compute each evaluation's dimension average and the diff
+    # to its successor, without materializing the score list first.
+    diffs = []
+    prev = None
     for r in recent:
         avg = (r.get("ethos", 0) + r.get("logos", 0) + r.get("pathos", 0)) / 3.0
-        scores.append(avg)
-
-    # Recent evaluations are in reverse chronological order (newest first)
-    # Check if trending up or down
-    diffs = [scores[i] - scores[i + 1] for i in range(len(scores) - 1)]
+        if prev is not None:
+            diffs.append(prev - avg)
+        prev = avg
     avg_diff = sum(diffs) / len(diffs)
 
     # Check volatility
@@ -109,6 +110,25 @@ def compute_grade(overall_score: float) -> str:
     return "F"
 
 
+def _avg_phronesis(evals: list[dict]) -> float:
+    """Average phronesis over a window in one accumulation pass.
+
+    Summing raw dimension values and dividing once by 3*N gives the same
+    result as averaging per-evaluation means, without building the
+    intermediate score list.
+    """
+    if not evals:
+        return 0.0
+    total = 0.0
+    for e in evals:
+        total += (
+            float(e.get("ethos", 0))
+            + float(e.get("logos", 0))
+            + float(e.get("pathos", 0))
+        )
+    return total / (3.0 * len(evals))
+
+
 def compute_trend(evaluations: list[dict]) -> str:
     """Compute phronesis trend from evaluation history.
 
@@ -122,21 +142,9 @@ def compute_trend(evaluations: list[dict]) -> str:
     if len(evaluations) < 10:
         return detect_temporal_pattern(evaluations)
 
-    def _avg_phronesis(evals: list[dict]) -> float:
-        scores = []
-        for e in evals:
-            ethos = float(e.get("ethos", 0))
-            logos = float(e.get("logos", 0))
-            pathos = float(e.get("pathos", 0))
-            scores.append((ethos + logos + pathos) / 3.0)
-        return sum(scores) / len(scores) if scores else 0.0
-
     # evaluations are ordered newest-first from get_evaluation_history
-    recent = evaluations[:5]
-    older = evaluations[5:10]
-
-    recent_avg = _avg_phronesis(recent)
-    older_avg = _avg_phronesis(older)
+    recent_avg = _avg_phronesis(evaluations[:5])
+    older_avg = _avg_phronesis(evaluations[5:10])
     diff = recent_avg - older_avg
 
     if diff > 0.1:
@@ -9,7 +9,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RoutingTier(str, Enum):
@@ -444,8 +444,13 @@ class InstinctResult(BaseModel):
 
     Pre-wired pattern matching that fires before experience.
     Determines routing tier for deliberation depth.
+
+    Frozen: evaluation reads these as immutable value objects, and
+    freezing keeps downstream caches safe from aliasing bugs.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     total_flags: int = 0
     flagged_traits: dict[str, int] = Field(default_factory=dict)
     density: float = 0.0
@@ -461,8 +466,12 @@ class IntuitionResult(BaseModel):
 
     Accumulated wisdom from past evaluations. Tells deliberation
     where to look harder, not what the score should be.
+
+    Frozen for the same reason as InstinctResult.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     confidence_adjustment: float = Field(default=0.0, ge=-1.0, le=1.0)
     similar_cases: int = 0
     anomaly_flags: list[str] = Field(default_factory=list)
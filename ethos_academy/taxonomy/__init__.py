@@ -6,8 +6,10 @@ from ethos_academy.taxonomy.constitution import (
     ANTHROPIC_ASSESSMENTS,
     CONSTITUTIONAL_VALUES,
     HARD_CONSTRAINTS,
+    HARD_CONSTRAINTS_BY_ID,
     INDICATOR_ASSESSMENT_MAPPINGS,
     LEGITIMACY_TESTS,
+    LEGITIMACY_TESTS_BY_NAME,
     SABOTAGE_PATHWAYS,
 )
 from ethos_academy.taxonomy.rubrics import SCORING_RUBRIC
@@ -19,7 +21,9 @@ __all__ = [
     "INDICATORS",
     "CONSTITUTIONAL_VALUES",
     "HARD_CONSTRAINTS",
+    "HARD_CONSTRAINTS_BY_ID",
     "LEGITIMACY_TESTS",
+    "LEGITIMACY_TESTS_BY_NAME",
     "SABOTAGE_PATHWAYS",
     "SCORING_RUBRIC",
     "ANTHROPIC_ASSESSMENTS",
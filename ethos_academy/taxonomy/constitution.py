@@ -5,6 +5,9 @@ and the Claude 4 System Card (May 2025).
 Pure data. No logic, no I/O.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 CONSTITUTIONAL_VALUES: dict[str, dict] = {
     "safety": {
         "priority": 1,
@@ -88,6 +91,16 @@ LEGITIMACY_TESTS: list[dict] = [
     },
 ]
 
+# Read-only key lookups, built once at import. Callers that need one
+# constraint or test by identity use these instead of scanning the lists.
+HARD_CONSTRAINTS_BY_ID: Mapping[str, dict] = MappingProxyType(
+    {hc["id"]: hc for hc in HARD_CONSTRAINTS}
+)
+
+LEGITIMACY_TESTS_BY_NAME: Mapping[str, dict] = MappingProxyType(
+    {lt["name"]: lt for lt in LEGITIMACY_TESTS}
+)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Sabotage risk pathways — from Anthropic's Sabotage Risk Report
 # (Claude Opus 4.6, 2026)
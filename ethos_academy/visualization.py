@@ -13,8 +13,11 @@ This reveals which behavioral signals each agent activates and how the
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import itertools
 import math
+import sys
 
 from ethos_academy.graph.service import graph_context
 from ethos_academy.graph.visualization import (
@@ -60,8 +63,13 @@ async def get_graph_data() -> GraphData:
             if not service.connected:
                 return GraphData()
 
-            indicator_rows = await get_indicator_frequency_data(service)
-            agent_rows = await get_agent_indicator_data(service)
+            # The two queries share no data; run both round-trips at once.
+            # execute_query opens its own session per call, so concurrent
+            # use of one service is safe.
+            indicator_rows, agent_rows = await asyncio.gather(
+                get_indicator_frequency_data(service),
+                get_agent_indicator_data(service),
+            )
             return _build_radial_graph(indicator_rows, agent_rows)
 
     except Exception as exc:
@@ -73,10 +81,15 @@ def _build_radial_graph(
     indicator_rows: list[dict],
     agent_rows: list[dict],
 ) -> GraphData:
-    """Build radial graph: Academy → Dimensions → Traits → Indicators → Agents."""
+    """Build radial graph: Academy → Dimensions → Traits → Indicators → Agents.
+
+    Hot path of the visualization endpoint: nodes and rels come straight
+    from our own graph layer, so model_construct skips per-object Pydantic
+    validation throughout.
+    """
     nodes: list[GraphNode] = []
     relationships: list[GraphRel] = []
-    rel_id = 0
+    rel_ids = itertools.count(1)
 
     # ── Parse indicator taxonomy ───────────────────────────────────────────
     trait_to_dim: dict[str, str] = {}
@@ -85,10 +98,14 @@ def _build_radial_graph(
     trait_indicators: dict[str, list[dict]] = {}
 
     for row in indicator_rows:
-        dim = row["dimension"]
-        trait = row["trait"]
+        # Each Neo4j row carries fresh string objects for values that
+        # repeat across the taxonomy (3 dimensions, 12 traits, 2
+        # polarities). Interning collapses them to one object apiece
+        # before they fan out into hundreds of node properties.
+        dim = sys.intern(row["dimension"])
+        trait = sys.intern(row["trait"])
         trait_to_dim[trait] = dim
-        trait_polarity[trait] = row.get("trait_polarity", "positive")
+        trait_polarity[trait] = sys.intern(row.get("trait_polarity", "positive"))
         if trait not in dim_traits.get(dim, []):
             dim_traits.setdefault(dim, []).append(trait)
         trait_indicators.setdefault(trait, []).append(row)
@@ -105,7 +122,7 @@ def _build_radial_graph(
 
     # ── Center node: Ethos Academy ─────────────────────────────────────────
     nodes.append(
-        GraphNode(
+        GraphNode.model_construct(
             id="academy",
             type="academy",
             label="Ethos Academy",
@@ -123,7 +140,7 @@ def _build_radial_graph(
         dim_positions[dim_key] = (dx, dy)
 
         nodes.append(
-            GraphNode(
+            GraphNode.model_construct(
                 id=f"dim-{dim_key}",
                 type="dimension",
                 label=dim_key,
@@ -133,10 +150,9 @@ def _build_radial_graph(
         )
 
         # Academy → Dimension
-        rel_id += 1
         relationships.append(
-            GraphRel(
-                id=f"rel-{rel_id}",
+            GraphRel.model_construct(
+                id=f"rel-{next(rel_ids)}",
                 from_id="academy",
                 to_id=f"dim-{dim_key}",
                 type="HAS_DIMENSION",
@@ -166,7 +182,7 @@ def _build_radial_graph(
 
             polarity = trait_polarity.get(trait, "positive")
             nodes.append(
-                GraphNode(
+                GraphNode.model_construct(
                     id=f"trait-{trait}",
                     type="trait",
                     label=trait,
@@ -182,10 +198,9 @@ def _build_radial_graph(
             )
 
             # Dimension → Trait
-            rel_id += 1
             relationships.append(
-                GraphRel(
-                    id=f"rel-{rel_id}",
+                GraphRel.model_construct(
+                    id=f"rel-{next(rel_ids)}",
                     from_id=f"dim-{dim_key}",
                     to_id=f"trait-{trait}",
                     type="BELONGS_TO",
@@ -219,7 +234,7 @@ def _build_radial_graph(
             indicator_angles[ind_id] = angle
 
             nodes.append(
-                GraphNode(
+                GraphNode.model_construct(
                     id=f"ind-{ind_id}",
                     type="indicator",
                     label=ind["indicator_name"],
@@ -238,10 +253,9 @@ def _build_radial_graph(
             )
 
             # Trait → Indicator
-            rel_id += 1
             relationships.append(
-                GraphRel(
-                    id=f"rel-{rel_id}",
+                GraphRel.model_construct(
+                    id=f"rel-{next(rel_ids)}",
                     from_id=f"trait-{trait}",
                     to_id=f"ind-{ind_id}",
                     type="INDICATES",
@@ -291,7 +305,7 @@ def _build_radial_graph(
         total_detections = sum(r["times_detected"] for r in ind_rows)
 
         nodes.append(
-            GraphNode(
+            GraphNode.model_construct(
                 id=f"agent-{aid}",
                 type="agent",
                 label=meta["name"],
@@ -311,17 +325,15 @@ def _build_radial_graph(
         top_indicators = sorted(
             ind_rows, key=lambda r: r["times_detected"], reverse=True
         )[:10]
-        for row in top_indicators:
-            ind_id = row["indicator_id"]
-            rel_id += 1
-            relationships.append(
-                GraphRel(
-                    id=f"rel-{rel_id}",
-                    from_id=f"agent-{aid}",
-                    to_id=f"ind-{ind_id}",
-                    type="TRIGGERED",
-                    properties={"weight": row["times_detected"]},
-                )
+        relationships.extend(
+            GraphRel.model_construct(
+                id=f"rel-{next(rel_ids)}",
+                from_id=f"agent-{aid}",
+                to_id=f"ind-{row['indicator_id']}",
+                type="TRIGGERED",
+                properties={"weight": row["times_detected"]},
             )
+            for row in top_indicators
+        )
 
     return GraphData(nodes=nodes, relationships=relationships)
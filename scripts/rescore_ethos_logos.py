@@ -63,16 +63,6 @@ WHERE e.message_content IS NOT NULL
 RETURN e.evaluation_id AS evaluation_id,
        e.message_content AS message_content,
        e.direction AS direction,
-       e.trait_virtue AS old_virtue,
-       e.trait_goodwill AS old_goodwill,
-       e.trait_manipulation AS old_manipulation,
-       e.trait_deception AS old_deception,
-       e.trait_accuracy AS old_accuracy,
-       e.trait_reasoning AS old_reasoning,
-       e.trait_fabrication AS old_fabrication,
-       e.trait_broken_logic AS old_broken_logic,
-       e.ethos AS old_ethos,
-       e.logos AS old_logos,
        e.trait_recognition AS trait_recognition,
        e.trait_compassion AS trait_compassion,
        e.trait_dismissal AS trait_dismissal,
@@ -82,41 +72,83 @@ RETURN e.evaluation_id AS evaluation_id,
 ORDER BY e.created_at
 """
 
+# Same names and shapes as scripts/seed_graph.py. IF NOT EXISTS makes
+# them no-ops on a seeded graph; on an older graph they turn the MATCH
+# lookups below into index seeks instead of full node scans.
+_ENSURE_CONSTRAINTS = (
+    "CREATE CONSTRAINT agent_id_unique IF NOT EXISTS "
+    "FOR (a:Agent) REQUIRE a.agent_id IS UNIQUE",
+    "CREATE CONSTRAINT evaluation_id_unique IF NOT EXISTS "
+    "FOR (e:Evaluation) REQUIRE e.evaluation_id IS UNIQUE",
+    "CREATE INDEX evaluation_created_at IF NOT EXISTS "
+    "FOR (e:Evaluation) ON (e.created_at)",
+)
+
+# Before-values for the summary table, aggregated server-side in one
+# row. Runs just before the write phase overwrites them; keeping these
+# out of the main fetch saves ten floats per evaluation on the wire.
+_FETCH_OLD_AVERAGES = """
+MATCH (e:Evaluation)
+WHERE e.evaluation_id IN $ids
+RETURN avg(e.trait_virtue) AS virtue,
+       avg(e.trait_goodwill) AS goodwill,
+       avg(e.trait_manipulation) AS manipulation,
+       avg(e.trait_deception) AS deception,
+       avg(e.trait_accuracy) AS accuracy,
+       avg(e.trait_reasoning) AS reasoning,
+       avg(e.trait_fabrication) AS fabrication,
+       avg(e.trait_broken_logic) AS broken_logic,
+       avg(e.ethos) AS ethos,
+       avg(e.logos) AS logos
+"""
+
 _UPDATE_ETHOS_LOGOS = """
-MATCH (e:Evaluation {evaluation_id: $evaluation_id})
-SET e.trait_virtue = $virtue,
-    e.trait_goodwill = $goodwill,
-    e.trait_manipulation = $manipulation,
-    e.trait_deception = $deception,
-    e.trait_accuracy = $accuracy,
-    e.trait_reasoning = $reasoning,
-    e.trait_fabrication = $fabrication,
-    e.trait_broken_logic = $broken_logic,
-    e.ethos = $ethos,
-    e.logos = $logos,
-    e.alignment_status = $alignment_status,
-    e.phronesis = $phronesis,
-    e.phronesis_score = $phronesis_score
-RETURN e.evaluation_id AS updated
+UNWIND $rows AS row
+MATCH (e:Evaluation {evaluation_id: row.evaluation_id})
+SET e.trait_virtue = row.virtue,
+    e.trait_goodwill = row.goodwill,
+    e.trait_manipulation = row.manipulation,
+    e.trait_deception = row.deception,
+    e.trait_accuracy = row.accuracy,
+    e.trait_reasoning = row.reasoning,
+    e.trait_fabrication = row.fabrication,
+    e.trait_broken_logic = row.broken_logic,
+    e.ethos = row.ethos,
+    e.logos = row.logos,
+    e.alignment_status = row.alignment_status,
+    e.phronesis = row.phronesis,
+    e.phronesis_score = row.phronesis_score
+RETURN count(e) AS updated
 """
 
+# Rows per UNWIND write. One round-trip per batch instead of per
+# evaluation; 500 keeps each transaction inside default memory limits.
+WRITE_BATCH_SIZE = 500
+
+# UNWIND batches in flight at once. Batches touch disjoint Evaluation
+# nodes, so they commit independently and overlap network latency.
+WRITE_CONCURRENCY = 5
+
 _UPDATE_AGENT_AGGREGATES = """
-MATCH (a:Agent {agent_id: $agent_id})-[:EVALUATED]->(e:Evaluation)
+UNWIND $agent_ids AS aid
+MATCH (a:Agent {agent_id: aid})-[:EVALUATED]->(e:Evaluation)
 WITH a,
      avg(e.ethos) AS avg_ethos,
      avg(e.logos) AS avg_logos,
      avg(e.pathos) AS avg_pathos
-SET a.phronesis_score = round((avg_ethos + avg_logos + avg_pathos) / 3.0, 4),
+WITH a, avg_ethos, avg_logos, avg_pathos,
+     (avg_ethos + avg_logos + avg_pathos) / 3.0 AS mean
+SET a.phronesis_score = round(mean, 4),
     a.balance_score = CASE
-        WHEN (avg_ethos + avg_logos + avg_pathos) / 3.0 > 0
+        WHEN mean > 0
         THEN round(toFloat(1.0 - sqrt(
-            ((avg_ethos - (avg_ethos+avg_logos+avg_pathos)/3.0)^2 +
-             (avg_logos - (avg_ethos+avg_logos+avg_pathos)/3.0)^2 +
-             (avg_pathos - (avg_ethos+avg_logos+avg_pathos)/3.0)^2) / 3.0
-        ) / ((avg_ethos + avg_logos + avg_pathos) / 3.0)), 4)
+            ((avg_ethos - mean)^2 +
+             (avg_logos - mean)^2 +
+             (avg_pathos - mean)^2) / 3.0
+        ) / mean), 4)
         ELSE 0.0
     END
-RETURN a.agent_id AS updated, a.phronesis_score AS score, a.balance_score AS balance
+RETURN count(a) AS updated
 """
 
 
@@ -193,8 +225,9 @@ async def _evaluate_full(
 ) -> dict[str, float]:
     async with semaphore:
         result = await evaluate(text, direction=direction or "outbound")
+        traits = result.traits
         return {
-            trait: result.traits[trait].score if trait in result.traits else 0.0
+            trait: ts.score if (ts := traits.get(trait)) is not None else 0.0
             for trait in ALL_TRAITS
         }
 
@@ -202,110 +235,154 @@ async def _evaluate_full(
 # ── Write results to Neo4j ─────────────────────────────────────────
 
 
+def _build_update_row(r: dict) -> dict:
+    """Build one UNWIND row: new trait scores plus recomputed dimensions."""
+    scores = r["scores"]
+    old = r["old"]
+
+    all_traits = {
+        "virtue": scores["virtue"],
+        "goodwill": scores["goodwill"],
+        "manipulation": scores["manipulation"],
+        "deception": scores["deception"],
+        "accuracy": scores["accuracy"],
+        "reasoning": scores["reasoning"],
+        "fabrication": scores["fabrication"],
+        "broken_logic": scores["broken_logic"],
+        "recognition": old.get("trait_recognition", 0.0) or 0.0,
+        "compassion": old.get("trait_compassion", 0.0) or 0.0,
+        "dismissal": old.get("trait_dismissal", 0.0) or 0.0,
+        "exploitation": old.get("trait_exploitation", 0.0) or 0.0,
+    }
+
+    new_ethos = _recompute_ethos(
+        scores["virtue"],
+        scores["goodwill"],
+        scores["manipulation"],
+        scores["deception"],
+    )
+    new_logos = _recompute_logos(
+        scores["accuracy"],
+        scores["reasoning"],
+        scores["fabrication"],
+        scores["broken_logic"],
+    )
+
+    pathos_dim = old.get("pathos", 0.0) or 0.0
+    alignment = _recompute_alignment(all_traits)
+    phronesis = _recompute_phronesis(new_ethos, new_logos, pathos_dim, alignment)
+    phronesis_score = round((new_ethos + new_logos + pathos_dim) / 3.0, 4)
+
+    # Cache the dimensions on the result so the summary reuses them
+    # instead of recomputing per row
+    r["new_ethos"] = new_ethos
+    r["new_logos"] = new_logos
+
+    return {
+        "evaluation_id": r["evaluation_id"],
+        "virtue": scores["virtue"],
+        "goodwill": scores["goodwill"],
+        "manipulation": scores["manipulation"],
+        "deception": scores["deception"],
+        "accuracy": scores["accuracy"],
+        "reasoning": scores["reasoning"],
+        "fabrication": scores["fabrication"],
+        "broken_logic": scores["broken_logic"],
+        "ethos": new_ethos,
+        "logos": new_logos,
+        "alignment_status": alignment,
+        "phronesis": phronesis,
+        "phronesis_score": phronesis_score,
+    }
+
+
 async def _write_to_graph(results: list[dict]):
-    """Write scored results to Neo4j."""
+    """Write scored results to Neo4j in UNWIND batches.
+
+    Returns (agent_ids, old_avgs): the touched agents and the pre-write
+    averages of the columns the summary table compares against.
+    """
     print(f"Writing {len(results)} updated ethos/logos scores to graph...")
+    rows = [_build_update_row(r) for r in results]
+    agent_ids = {r["agent_id"] for r in results}
+
     async with graph_context() as service:
-        agent_ids = set()
-        for r in results:
-            scores = r["scores"]
-            old = r["old"]
-
-            all_traits = {
-                "virtue": scores["virtue"],
-                "goodwill": scores["goodwill"],
-                "manipulation": scores["manipulation"],
-                "deception": scores["deception"],
-                "accuracy": scores["accuracy"],
-                "reasoning": scores["reasoning"],
-                "fabrication": scores["fabrication"],
-                "broken_logic": scores["broken_logic"],
-                "recognition": old.get("trait_recognition", 0.0) or 0.0,
-                "compassion": old.get("trait_compassion", 0.0) or 0.0,
-                "dismissal": old.get("trait_dismissal", 0.0) or 0.0,
-                "exploitation": old.get("trait_exploitation", 0.0) or 0.0,
-            }
+        for ddl in _ENSURE_CONSTRAINTS:
+            await service.execute_query(ddl, {})
 
-            new_ethos = _recompute_ethos(
-                scores["virtue"],
-                scores["goodwill"],
-                scores["manipulation"],
-                scores["deception"],
-            )
-            new_logos = _recompute_logos(
-                scores["accuracy"],
-                scores["reasoning"],
-                scores["fabrication"],
-                scores["broken_logic"],
-            )
+        # Snapshot the before-averages while the old values still exist
+        old_records, _, _ = await service.execute_query(
+            _FETCH_OLD_AVERAGES,
+            {"ids": [r["evaluation_id"] for r in rows]},
+        )
+        old_avgs = dict(old_records[0]) if old_records else {}
 
-            pathos_dim = old.get("pathos", 0.0) or 0.0
-            alignment = _recompute_alignment(all_traits)
-            phronesis = _recompute_phronesis(
-                new_ethos, new_logos, pathos_dim, alignment
-            )
-            phronesis_score = round((new_ethos + new_logos + pathos_dim) / 3.0, 4)
-
-            await service.execute_query(
-                _UPDATE_ETHOS_LOGOS,
-                {
-                    "evaluation_id": r["evaluation_id"],
-                    "virtue": scores["virtue"],
-                    "goodwill": scores["goodwill"],
-                    "manipulation": scores["manipulation"],
-                    "deception": scores["deception"],
-                    "accuracy": scores["accuracy"],
-                    "reasoning": scores["reasoning"],
-                    "fabrication": scores["fabrication"],
-                    "broken_logic": scores["broken_logic"],
-                    "ethos": new_ethos,
-                    "logos": new_logos,
-                    "alignment_status": alignment,
-                    "phronesis": phronesis,
-                    "phronesis_score": phronesis_score,
-                },
+        write_sem = asyncio.Semaphore(WRITE_CONCURRENCY)
+
+        async def _write_batch(batch: list[dict]) -> None:
+            async with write_sem:
+                await service.execute_query(_UPDATE_ETHOS_LOGOS, {"rows": batch})
+
+        await asyncio.gather(
+            *(
+                _write_batch(rows[start : start + WRITE_BATCH_SIZE])
+                for start in range(0, len(rows), WRITE_BATCH_SIZE)
             )
-            agent_ids.add(r["agent_id"])
+        )
 
         print(f"Updating aggregates for {len(agent_ids)} agents...")
-        for agent_id in agent_ids:
-            await service.execute_query(
-                _UPDATE_AGENT_AGGREGATES, {"agent_id": agent_id}
-            )
+        await service.execute_query(
+            _UPDATE_AGENT_AGGREGATES, {"agent_ids": list(agent_ids)}
+        )
 
-    return agent_ids
+    return agent_ids, old_avgs
 
 
-def _print_summary(results: list[dict], agent_ids: set[str]):
-    """Print before/after summary."""
+async def _drain_writes(service, write_queue: asyncio.Queue) -> None:
+    """Flush scored results to Neo4j in UNWIND batches as they arrive.
+
+    Runs alongside the scoring workers so DB commits overlap LLM
+    latency. None is the stop sentinel; the remainder batch flushes on
+    shutdown or queue close.
+    """
+    batch: list[dict] = []
+    while True:
+        item = await write_queue.get()
+        if item is None:
+            break
+        batch.append(_build_update_row(item))
+        if len(batch) >= WRITE_BATCH_SIZE:
+            await service.execute_query(_UPDATE_ETHOS_LOGOS, {"rows": batch})
+            batch = []
+    if batch:
+        await service.execute_query(_UPDATE_ETHOS_LOGOS, {"rows": batch})
+
+
+def _print_summary(results: list[dict], agent_ids: set[str], old_avgs: dict):
+    """Print before/after summary.
+
+    old_avgs holds the pre-write column averages from
+    _FETCH_OLD_AVERAGES; missing or null columns print as 0.
+    """
     n = len(results)
-    old_ethos_avg = sum((r["old"].get("old_ethos") or 0.0) for r in results) / n
-    new_ethos_avg = (
-        sum(
-            _recompute_ethos(
-                r["scores"]["virtue"],
-                r["scores"]["goodwill"],
-                r["scores"]["manipulation"],
-                r["scores"]["deception"],
-            )
-            for r in results
-        )
-        / n
-    )
 
-    old_logos_avg = sum((r["old"].get("old_logos") or 0.0) for r in results) / n
-    new_logos_avg = (
-        sum(
-            _recompute_logos(
-                r["scores"]["accuracy"],
-                r["scores"]["reasoning"],
-                r["scores"]["fabrication"],
-                r["scores"]["broken_logic"],
-            )
-            for r in results
-        )
-        / n
-    )
+    # One pass over results accumulates every column the table needs,
+    # instead of ten separate generator reductions
+    trait_sums = dict.fromkeys(ALL_TRAITS, 0.0)
+    ethos_sum = 0.0
+    logos_sum = 0.0
+    for r in results:
+        s = r["scores"]
+        for trait in ALL_TRAITS:
+            trait_sums[trait] += s[trait]
+        ethos_sum += r["new_ethos"]
+        logos_sum += r["new_logos"]
+
+    old_ethos_avg = old_avgs.get("ethos") or 0.0
+    new_ethos_avg = ethos_sum / n
+
+    old_logos_avg = old_avgs.get("logos") or 0.0
+    new_logos_avg = logos_sum / n
 
     print(f"\n{'Metric':<20} {'Before':>10} {'After':>10} {'Delta':>10}")
     print("-" * 52)
@@ -317,9 +394,8 @@ def _print_summary(results: list[dict], agent_ids: set[str]):
     )
 
     for trait in ALL_TRAITS:
-        old_key = f"old_{trait}"
-        old_avg = sum((r["old"].get(old_key) or 0.0) for r in results) / n
-        new_avg = sum(r["scores"][trait] for r in results) / n
+        old_avg = old_avgs.get(trait) or 0.0
+        new_avg = trait_sums[trait] / n
         print(
             f"  {trait:<18} {old_avg:>10.4f} {new_avg:>10.4f} {new_avg - old_avg:>+10.4f}"
         )
@@ -343,8 +419,8 @@ async def _import_from_jsonl(jsonl_path: Path):
         print("No results to import.")
         return
 
-    agent_ids = await _write_to_graph(results)
-    _print_summary(results, agent_ids)
+    agent_ids, old_avgs = await _write_to_graph(results)
+    _print_summary(results, agent_ids, old_avgs)
 
 
 # ── Main ────────────────────────────────────────────────────────────
@@ -377,13 +453,23 @@ async def main():
         await _import_from_jsonl(args.from_jsonl)
         return
 
-    # Fetch evaluations from graph
-    async with graph_context() as service:
-        records, _, _ = await service.execute_query(_FETCH_EVALS, {})
-
-    evals = [dict(r) for r in records]
+    # Fetch evaluations from graph. Streaming keeps only the dicts in
+    # memory; execute_query would hold the raw record list alongside
+    # them, doubling peak RSS for message-content-heavy rows.
+    # --limit runs server-side so the DB never sorts and ships rows we
+    # would slice away. The created_at index backs the ORDER BY.
+    fetch_query = _FETCH_EVALS
+    fetch_params: dict = {}
     if args.limit:
-        evals = evals[: args.limit]
+        fetch_query += "LIMIT $limit\n"
+        fetch_params["limit"] = args.limit
+
+    evals: list[dict] = []
+    async with graph_context() as service:
+        for ddl in _ENSURE_CONSTRAINTS:
+            await service.execute_query(ddl, {})
+        async for record in service.stream_query(fetch_query, fetch_params):
+            evals.append(dict(record))
 
     total = len(evals)
     est_cost = total * 0.003
@@ -393,8 +479,11 @@ async def main():
     if args.dry_run:
         return
 
-    # Check for existing JSONL to resume from
+    # Check for existing JSONL to resume from. Keep the full records:
+    # an interrupted run scored them but may never have written them,
+    # so they replay through the writer below.
     already_done: set[str] = set()
+    prior_results: list[dict] = []
     jsonl_path: Path = args.output
     jsonl_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -403,6 +492,7 @@ async def main():
             for line in f:
                 rec = json.loads(line)
                 already_done.add(rec["evaluation_id"])
+                prior_results.append(rec)
         if already_done:
             print(f"Resuming: {len(already_done)} already scored in {jsonl_path}")
             evals = [e for e in evals if e["evaluation_id"] not in already_done]
@@ -441,49 +531,95 @@ async def main():
             logger.error("Failed %s: %s", ev["evaluation_id"][:8], exc)
             return None
 
-    tasks = [process(ev) for ev in evals]
-
+    # Fixed worker pool over a bounded queue. Scheduling all N
+    # coroutines up front holds a pending future per evaluation; a pool
+    # of CONCURRENCY workers keeps at most a handful in flight. None is
+    # the stop sentinel, one per worker, queued after the real work.
+    work_queue: asyncio.Queue[dict | None] = asyncio.Queue(maxsize=CONCURRENCY * 2)
     done = 0
-    for coro in asyncio.as_completed(tasks):
-        result = await coro
-        done += 1
-        if result:
-            results.append(result)
-            # Stream to JSONL immediately
-            jsonl_file.write(json.dumps(result) + "\n")
-            jsonl_file.flush()
-        if done % 25 == 0 or done == total_scoring:
-            elapsed = time.time() - t0
-            rate = done / elapsed if elapsed > 0 else 0
-            eta = (total_scoring - done) / rate if rate > 0 else 0
-            print(
-                f"  [{done}/{total_scoring}] {elapsed:.0f}s elapsed, "
-                f"{rate:.1f}/s, ~{eta:.0f}s remaining, {errors} errors",
-                flush=True,
-            )
-        if _shutdown and done >= len([t for t in tasks if not t.done()]):
-            break
 
-    jsonl_file.close()
-    elapsed = time.time() - t0
-    total_scored = len(already_done) + len(results)
-    print(
-        f"\nScored {len(results)}/{total_scoring} in {elapsed:.1f}s ({errors} errors)"
-    )
-    print(f"Total in JSONL: {total_scored} ({jsonl_path})")
+    async def worker() -> None:
+        nonlocal done
+        while True:
+            ev = await work_queue.get()
+            work_queue.task_done()
+            if ev is None:
+                return
+            result = await process(ev)
+            done += 1
+            if result:
+                results.append(result)
+                # Stream to JSONL immediately
+                jsonl_file.write(json.dumps(result) + "\n")
+                jsonl_file.flush()
+                await write_queue.put(result)
+            if done % 25 == 0 or done == total_scoring:
+                elapsed = time.time() - t0
+                rate = done / elapsed if elapsed > 0 else 0
+                eta = (total_scoring - done) / rate if rate > 0 else 0
+                print(
+                    f"  [{done}/{total_scoring}] {elapsed:.0f}s elapsed, "
+                    f"{rate:.1f}/s, ~{eta:.0f}s remaining, {errors} errors",
+                    flush=True,
+                )
+
+    # Pipeline: scoring workers feed a writer task that flushes UNWIND
+    # batches while later evaluations are still in flight, instead of
+    # holding every write until the last LLM call returns.
+    write_queue: asyncio.Queue[dict | None] = asyncio.Queue()
 
-    if not results and not already_done:
-        print("No results to write.")
-        return
+    async with graph_context() as service:
+        # Snapshot before-averages for everything this run will write,
+        # while the old values still exist
+        old_records, _, _ = await service.execute_query(
+            _FETCH_OLD_AVERAGES,
+            {
+                "ids": [r["evaluation_id"] for r in prior_results]
+                + [e["evaluation_id"] for e in evals]
+            },
+        )
+        old_avgs = dict(old_records[0]) if old_records else {}
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(_drain_writes(service, write_queue))
+
+            # Replay resumed results through the writer first
+            for r in prior_results:
+                await write_queue.put(r)
+
+            async with asyncio.TaskGroup() as scoring_tg:
+                for _ in range(CONCURRENCY):
+                    scoring_tg.create_task(worker())
+                for ev in evals:
+                    if _shutdown:
+                        break
+                    await work_queue.put(ev)
+                for _ in range(CONCURRENCY):
+                    await work_queue.put(None)
+
+            # Workers are done; let the writer flush and exit
+            await write_queue.put(None)
+
+        jsonl_file.close()
+        elapsed = time.time() - t0
+        total_scored = len(already_done) + len(results)
+        print(
+            f"\nScored {len(results)}/{total_scoring} in {elapsed:.1f}s ({errors} errors)"
+        )
+        print(f"Total in JSONL: {total_scored} ({jsonl_path})")
 
-    # Load all results (including previously scored) for graph write
-    all_results = []
-    with open(jsonl_path) as f:
-        for line in f:
-            all_results.append(json.loads(line))
+        all_results = prior_results + results
+        if not all_results:
+            print("No results to write.")
+            return
+
+        agent_ids = {r["agent_id"] for r in all_results}
+        print(f"Updating aggregates for {len(agent_ids)} agents...")
+        await service.execute_query(
+            _UPDATE_AGENT_AGGREGATES, {"agent_ids": list(agent_ids)}
+        )
 
-    agent_ids = await _write_to_graph(all_results)
-    _print_summary(all_results, agent_ids)
+    _print_summary(all_results, agent_ids, old_avgs)
 
 
 if __name__ == "__main__":
@@ -2,14 +2,14 @@
 
 import pytest
 
-from api.rate_limit import _requests, _phone_requests
+from api.rate_limit import clear_stores, reset_limit
 
 
 @pytest.fixture(autouse=True)
 def _clear_rate_limits():
     """Reset in-memory rate limiter between tests to prevent bleed."""
-    _requests.clear()
-    _phone_requests.clear()
+    clear_stores()
+    reset_limit()
     yield
-    _requests.clear()
-    _phone_requests.clear()
+    clear_stores()
+    reset_limit()
@@ -210,9 +210,9 @@ _EVAL_PAYLOAD = {"text": "test message", "source": "test-agent"}
 
 class TestExceptionHandlers:
     def setup_method(self):
-        from api.rate_limit import _requests
+        from api.rate_limit import clear_stores
 
-        _requests.clear()
+        clear_stores()
 
     def test_graph_unavailable_returns_503(self):
         from ethos_academy.shared.errors import GraphUnavailableError
@@ -292,9 +292,9 @@ class TestExceptionHandlers:
 
 class TestInputValidation:
     def setup_method(self):
-        from api.rate_limit import _requests
+        from api.rate_limit import clear_stores
 
-        _requests.clear()
+        clear_stores()
 
     def test_empty_text_rejected(self):
         resp = client.post("/evaluate/incoming", json={"text": "", "source": "a"})
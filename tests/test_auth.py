@@ -27,7 +27,7 @@ def _clear_env(monkeypatch):
 @pytest.fixture(autouse=True)
 def _clean_rate_limit():
     """Reset rate limiter between tests."""
-    rate_limit_module._requests.clear()
+    rate_limit_module.clear_stores()
 
 
 @pytest.fixture(autouse=True)
@@ -151,6 +151,7 @@ class TestRateLimitBeforeAuth:
     def _set_api_key(self, monkeypatch):
         monkeypatch.setenv("ETHOS_API_KEY", "test-secret-key")
         monkeypatch.setenv("ETHOS_RATE_LIMIT", "3")
+        rate_limit_module.reset_limit()
 
     def test_unauthenticated_flood_gets_429(self, client):
         """Spraying bad keys should hit rate limit, not just 401 forever."""
@@ -41,7 +41,7 @@ def _clear_env(monkeypatch):
 @pytest.fixture(autouse=True)
 def _clean_rate_limit():
     """Reset rate limiter between tests."""
-    rate_limit_module._requests.clear()
+    rate_limit_module.clear_stores()
 
 
 # ---------------------------------------------------------------------------
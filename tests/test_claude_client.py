@@ -16,14 +16,12 @@ from ethos_academy.shared.errors import ConfigError, EvaluationError
 
 @pytest.fixture(autouse=True)
 def _reset_shared_client():
-    """Reset the singleton Anthropic client between tests."""
+    """Reset the cached Anthropic clients between tests."""
     import ethos_academy.evaluation.claude_client as mod
 
-    mod._shared_client = None
-    mod._shared_client_key = None
+    mod._clients.clear()
     yield
-    mod._shared_client = None
-    mod._shared_client_key = None
+    mod._clients.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -469,6 +467,114 @@ class TestAuthenticationErrorHandling:
         assert str(exc_info.value) == "Invalid Anthropic API key"
 
 
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+
+class TestStreaming:
+    """call_claude_streaming yields text chunks as they arrive."""
+
+    @patch("ethos_academy.evaluation.claude_client.anthropic")
+    @patch("ethos_academy.evaluation.claude_client.EthosConfig.from_env")
+    async def test_yields_text_chunks(self, mock_from_env, mock_anthropic):
+        from ethos_academy.evaluation.claude_client import call_claude_streaming
+
+        cfg = MagicMock()
+        cfg.anthropic_api_key = "test-key"
+        mock_from_env.return_value = cfg
+
+        async def _text_stream():
+            yield "first "
+            yield "second"
+
+        stream = MagicMock()
+        stream.text_stream = _text_stream()
+        manager = MagicMock()
+        manager.__aenter__ = AsyncMock(return_value=stream)
+        manager.__aexit__ = AsyncMock(return_value=False)
+
+        mock_anthropic.AuthenticationError = anthropic.AuthenticationError
+        mock_client = AsyncMock()
+        mock_client.messages.stream = MagicMock(return_value=manager)
+        mock_anthropic.AsyncAnthropic.return_value = mock_client
+
+        chunks = [c async for c in call_claude_streaming("sys", "usr", "deep")]
+
+        assert chunks == ["first ", "second"]
+        call_args = mock_client.messages.stream.call_args
+        assert call_args.kwargs["model"] == "claude-opus-4-6"
+
+
+# ---------------------------------------------------------------------------
+# Response cache -- ETHOS_CACHE_MODE
+# ---------------------------------------------------------------------------
+
+
+class TestResponseCache:
+    """call_claude honors ETHOS_CACHE_MODE for repeat prompts."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from ethos_academy.evaluation.claude_client import clear_response_cache
+
+        clear_response_cache()
+        yield
+        clear_response_cache()
+
+    @patch("ethos_academy.evaluation.claude_client.anthropic")
+    @patch("ethos_academy.evaluation.claude_client.EthosConfig.from_env")
+    @patch.dict("os.environ", {"ETHOS_CACHE_MODE": "enabled"})
+    async def test_repeat_prompt_hits_cache(self, mock_from_env, mock_anthropic):
+        from ethos_academy.evaluation.claude_client import call_claude
+
+        cfg = MagicMock()
+        cfg.anthropic_api_key = "test-key"
+        mock_from_env.return_value = cfg
+
+        mock_anthropic.AuthenticationError = anthropic.AuthenticationError
+        mock_client = AsyncMock()
+        mock_anthropic.AsyncAnthropic.return_value = mock_client
+        mock_client.messages.create.return_value = MagicMock(
+            content=[MagicMock(type="text", text="cached response")]
+        )
+
+        first = await call_claude("sys", "usr", "standard")
+        second = await call_claude("sys", "usr", "standard")
+
+        assert first == second == "cached response"
+        assert mock_client.messages.create.call_count == 1
+
+    @patch.dict("os.environ", {"ETHOS_CACHE_MODE": "replay"})
+    async def test_replay_miss_raises(self):
+        from ethos_academy.evaluation.claude_client import call_claude
+
+        with pytest.raises(EvaluationError, match="replay"):
+            await call_claude("sys", "usr", "standard")
+
+    @patch("ethos_academy.evaluation.claude_client.anthropic")
+    @patch("ethos_academy.evaluation.claude_client.EthosConfig.from_env")
+    @patch.dict("os.environ", {"ETHOS_CACHE_MODE": "disabled"})
+    async def test_disabled_mode_always_calls_api(self, mock_from_env, mock_anthropic):
+        from ethos_academy.evaluation.claude_client import call_claude
+
+        cfg = MagicMock()
+        cfg.anthropic_api_key = "test-key"
+        mock_from_env.return_value = cfg
+
+        mock_anthropic.AuthenticationError = anthropic.AuthenticationError
+        mock_client = AsyncMock()
+        mock_anthropic.AsyncAnthropic.return_value = mock_client
+        mock_client.messages.create.return_value = MagicMock(
+            content=[MagicMock(type="text", text="response")]
+        )
+
+        await call_claude("sys", "usr", "standard")
+        await call_claude("sys", "usr", "standard")
+
+        assert mock_client.messages.create.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # Security: regex redaction of sk-ant- in error messages
 # ---------------------------------------------------------------------------
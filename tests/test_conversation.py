@@ -3,7 +3,11 @@
 import json
 from unittest.mock import AsyncMock, patch
 
-from ethos_academy.conversation import analyze_conversation, _parse_response
+from ethos_academy.conversation import (
+    analyze_conversation,
+    analyze_conversations_batch,
+    _parse_response,
+)
 from ethos_academy.shared.models import (
     ConversationAnalysisResult,
     ConversationIndicator,
@@ -192,6 +196,78 @@ class TestAnalyzeConversation:
         assert "could not be parsed" in result.summary
 
 
+# ── analyze_conversations_batch tests ─────────────────────────────────
+
+
+def _batch_item(summary: str) -> dict:
+    return {
+        "conversation_indicators": [],
+        "interaction_quality": "steady",
+        "attachment_pattern": "secure",
+        "summary": summary,
+    }
+
+
+_THREAD = [
+    {"author": "user", "content": "I need help with X"},
+    {"author": "agent", "content": "Let me help you with X"},
+]
+
+
+class TestAnalyzeConversationsBatch:
+    """analyze_conversations_batch amortizes one Claude call across threads."""
+
+    async def test_empty_input_returns_empty(self):
+        assert await analyze_conversations_batch([]) == []
+
+    async def test_mismatched_agent_ids_raises(self):
+        import pytest
+
+        with pytest.raises(ValueError, match="same length"):
+            await analyze_conversations_batch([_THREAD], agent_ids=["a", "b"])
+
+    @patch("ethos_academy.conversation.call_claude", new_callable=AsyncMock)
+    async def test_single_call_covers_all_threads(self, mock_claude):
+        mock_claude.return_value = json.dumps(
+            [_batch_item("first"), _batch_item("second")]
+        )
+        results = await analyze_conversations_batch(
+            [_THREAD, _THREAD], agent_ids=["agent-1", "agent-2"]
+        )
+
+        mock_claude.assert_called_once()
+        assert [r.agent_id for r in results] == ["agent-1", "agent-2"]
+        assert [r.summary for r in results] == ["first", "second"]
+        assert all(r.thread_message_count == 2 for r in results)
+
+    @patch("ethos_academy.conversation.call_claude", new_callable=AsyncMock)
+    async def test_short_thread_skips_claude(self, mock_claude):
+        mock_claude.return_value = json.dumps([_batch_item("analyzed")])
+        short = [{"author": "user", "content": "hello"}]
+        results = await analyze_conversations_batch(
+            [short, _THREAD], agent_ids=["short-agent", "agent-2"]
+        )
+
+        mock_claude.assert_called_once()
+        assert results[0].agent_id == "short-agent"
+        assert results[0].summary == ""
+        assert results[1].summary == "analyzed"
+
+    @patch("ethos_academy.conversation.call_claude", new_callable=AsyncMock)
+    async def test_parse_failure_falls_back_to_per_thread(self, mock_claude):
+        mock_claude.side_effect = [
+            "not json at all",
+            json.dumps(_batch_item("solo one")),
+            json.dumps(_batch_item("solo two")),
+        ]
+        results = await analyze_conversations_batch(
+            [_THREAD, _THREAD], agent_ids=["agent-1", "agent-2"]
+        )
+
+        assert mock_claude.await_count == 3
+        assert sorted(r.summary for r in results) == ["solo one", "solo two"]
+
+
 # ── Import tests ──────────────────────────────────────────────────────
 
 
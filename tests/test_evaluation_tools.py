@@ -60,6 +60,14 @@ class TestToolListStructure:
             assert "properties" in schema
             assert "required" in schema
 
+    def test_serialized_payload_round_trips(self):
+        """Cached JSON bytes decode back to the live tool definitions."""
+        import json
+
+        from ethos_academy.evaluation.tools import get_tools_payload
+
+        assert json.loads(get_tools_payload()) == EVALUATION_TOOLS
+
     def test_descriptions_are_nonempty(self):
         for tool in EVALUATION_TOOLS:
             assert len(tool["description"]) > 20, (
@@ -3,7 +3,7 @@
 Unit tests that mock the Neo4j driver. Integration tests live in test_graph_integration.py.
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 from ethos_academy.shared.models import EvaluationResult
@@ -72,6 +72,41 @@ class TestGraphService:
         result = await gs.execute_query("RETURN 1")
         assert result == ([], None, None)
 
+    async def test_stream_query_yields_records(self):
+        from ethos_academy.graph.service import GraphService
+
+        class _FakeResult:
+            def __init__(self, records):
+                self._records = list(records)
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                if not self._records:
+                    raise StopAsyncIteration
+                return self._records.pop(0)
+
+        mock_session = AsyncMock()
+        mock_session.run.return_value = _FakeResult([{"n": 1}, {"n": 2}])
+
+        gs = GraphService()
+        gs._driver = MagicMock()
+        gs._driver.session.return_value.__aenter__ = AsyncMock(
+            return_value=mock_session
+        )
+        gs._driver.session.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        records = [r async for r in gs.stream_query("MATCH (n) RETURN n")]
+        assert records == [{"n": 1}, {"n": 2}]
+
+    async def test_stream_query_when_not_connected(self):
+        from ethos_academy.graph.service import GraphService
+
+        gs = GraphService()
+        records = [r async for r in gs.stream_query("RETURN 1")]
+        assert records == []
+
 
 # ── write.py ─────────────────────────────────────────────────────────
 
@@ -15,6 +15,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from ethos_academy.mcp_server import (
+    batch_execute,
     compare_agents,
     detect_behavioral_patterns,
     examine_message,
@@ -45,6 +46,16 @@ from ethos_academy.shared.models import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_read_cache():
+    """Clear the read-tool TTL cache so tests never see each other's entries."""
+    from ethos_academy.mcp_server import _read_cache
+
+    _read_cache.clear()
+    yield
+    _read_cache.clear()
+
+
 def _mock_evaluation_result(**overrides) -> EvaluationResult:
     defaults = {
         "evaluation_id": "eval-001",
@@ -359,6 +370,146 @@ class TestMCPToolsErrorPropagation:
                 await detect_behavioral_patterns.fn(agent_id="agent-1")
 
 
+class TestBatchExecute:
+    """batch_execute fans out read tools concurrently, results in request order."""
+
+    async def test_runs_calls_and_preserves_order(self):
+        profile = _mock_agent_profile()
+        alumni = AlumniResult(
+            trait_averages={"virtue": 0.72},
+            total_evaluations=150,
+        )
+        with (
+            patch(
+                "ethos_academy.mcp_server.get_agent",
+                new_callable=AsyncMock,
+                return_value=profile,
+            ),
+            patch(
+                "ethos_academy.mcp_server.get_alumni",
+                new_callable=AsyncMock,
+                return_value=alumni,
+            ),
+        ):
+            results = await batch_execute.fn(
+                calls=[
+                    {"tool": "get_student_profile", "args": {"agent_id": "agent-1"}},
+                    {"tool": "get_alumni_benchmarks"},
+                ]
+            )
+
+        assert len(results) == 2
+        assert results[0]["tool"] == "get_student_profile"
+        assert results[0]["result"]["agent_name"] == "test-agent"
+        assert results[1]["tool"] == "get_alumni_benchmarks"
+        assert results[1]["result"]["total_evaluations"] == 150
+
+    async def test_unknown_tool_fills_error_slot(self):
+        results = await batch_execute.fn(calls=[{"tool": "take_entrance_exam"}])
+
+        assert len(results) == 1
+        assert "result" not in results[0]
+        assert results[0]["error"] == "ValueError"
+        assert "non-batchable" in results[0]["detail"]
+
+    async def test_one_failure_does_not_fail_the_batch(self):
+        alumni = AlumniResult(trait_averages={}, total_evaluations=0)
+        with (
+            patch(
+                "ethos_academy.mcp_server.get_agent",
+                new_callable=AsyncMock,
+                side_effect=RuntimeError("Graph query failed"),
+            ),
+            patch(
+                "ethos_academy.mcp_server.get_alumni",
+                new_callable=AsyncMock,
+                return_value=alumni,
+            ),
+        ):
+            results = await batch_execute.fn(
+                calls=[
+                    {"tool": "get_student_profile", "args": {"agent_id": "agent-1"}},
+                    {"tool": "get_alumni_benchmarks"},
+                ]
+            )
+
+        assert results[0]["error"] == "RuntimeError"
+        assert results[0]["detail"] == "Graph query failed"
+        assert results[1]["result"]["total_evaluations"] == 0
+
+    async def test_rejects_oversized_batch(self):
+        calls = [{"tool": "get_alumni_benchmarks"}] * 21
+        with pytest.raises(ValueError, match="Batch too large"):
+            await batch_execute.fn(calls=calls)
+
+
+class TestReadToolCache:
+    """Profile, report, and alumni reads serve from a short TTL cache."""
+
+    async def test_repeat_read_skips_backend(self):
+        mock = _mock_agent_profile()
+        with patch(
+            "ethos_academy.mcp_server.get_agent",
+            new_callable=AsyncMock,
+            return_value=mock,
+        ) as backend:
+            first = await get_student_profile.fn(agent_id="agent-1")
+            second = await get_student_profile.fn(agent_id="agent-1")
+
+        assert backend.await_count == 1
+        assert first == second
+
+    async def test_expired_entry_reloads(self):
+        from ethos_academy.mcp_server import _read_cache
+
+        mock = AlumniResult(trait_averages={}, total_evaluations=5)
+        with patch(
+            "ethos_academy.mcp_server.get_alumni",
+            new_callable=AsyncMock,
+            return_value=mock,
+        ) as backend:
+            await get_alumni_benchmarks.fn()
+            expiry, value = _read_cache[("alumni",)]
+            _read_cache[("alumni",)] = (expiry - 60.0, value)
+            await get_alumni_benchmarks.fn()
+
+        assert backend.await_count == 2
+
+    async def test_write_invalidates_agent_entries(self):
+        profile = _mock_agent_profile()
+        evaluation = _mock_evaluation_result()
+        with (
+            patch(
+                "ethos_academy.mcp_server.get_agent",
+                new_callable=AsyncMock,
+                return_value=profile,
+            ) as backend,
+            patch(
+                "ethos_academy.mcp_server.evaluate_incoming",
+                new_callable=AsyncMock,
+                return_value=evaluation,
+            ),
+            patch("ethos_academy.mcp_server._require_byok_on_http"),
+        ):
+            await get_student_profile.fn(agent_id="agent-1")
+            await examine_message.fn(text="hello", source="agent-1")
+            await get_student_profile.fn(agent_id="agent-1")
+
+        assert backend.await_count == 2
+
+    async def test_different_agents_cache_separately(self):
+        mock = _mock_agent_profile()
+        with patch(
+            "ethos_academy.mcp_server.get_agent",
+            new_callable=AsyncMock,
+            return_value=mock,
+        ) as backend:
+            await get_student_profile.fn(agent_id="agent-1")
+            await get_student_profile.fn(agent_id="agent-2")
+
+        assert backend.await_count == 2
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Graph Insight MCP Tools (7 new read-only tools)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -21,7 +21,7 @@ def client():
 @pytest.fixture(autouse=True)
 def _clean_state(monkeypatch):
     """Reset rate limiter state and disable auth for isolated tests."""
-    rate_limit_module._requests.clear()
+    rate_limit_module.clear_stores()
     monkeypatch.delenv("ETHOS_API_KEY", raising=False)
 
 
@@ -41,6 +41,7 @@ class TestUnderLimit:
 
     def test_multiple_under_limit(self, client, monkeypatch):
         monkeypatch.setenv("ETHOS_RATE_LIMIT", "5")
+        rate_limit_module.reset_limit()
         for _ in range(5):
             resp = client.post("/evaluate/incoming", json=_EVAL_PAYLOAD)
             assert resp.status_code == 200
@@ -51,6 +52,7 @@ class TestOverLimit:
 
     def test_exceeds_limit(self, client, monkeypatch):
         monkeypatch.setenv("ETHOS_RATE_LIMIT", "3")
+        rate_limit_module.reset_limit()
         for _ in range(3):
             resp = client.post("/evaluate/incoming", json=_EVAL_PAYLOAD)
             assert resp.status_code == 200
@@ -62,6 +64,7 @@ class TestOverLimit:
 
     def test_retry_after_is_positive_integer(self, client, monkeypatch):
         monkeypatch.setenv("ETHOS_RATE_LIMIT", "1")
+        rate_limit_module.reset_limit()
         client.post("/evaluate/incoming", json=_EVAL_PAYLOAD)
         resp = client.post("/evaluate/incoming", json=_EVAL_PAYLOAD)
         assert resp.status_code == 429
@@ -74,6 +77,7 @@ class TestWindowExpiry:
 
     def test_window_reset(self, client, monkeypatch):
         monkeypatch.setenv("ETHOS_RATE_LIMIT", "2")
+        rate_limit_module.reset_limit()
 
         # Fill the window
         for _ in range(2):
@@ -83,9 +87,10 @@ class TestWindowExpiry:
         resp = client.post("/evaluate/incoming", json=_EVAL_PAYLOAD)
         assert resp.status_code == 429
 
-        # Simulate window expiry by backdating timestamps
-        for ip, timestamps in rate_limit_module._requests.items():
-            rate_limit_module._requests[ip] = [t - 61 for t in timestamps]
+        # Simulate window expiry by backdating the counter's bucket
+        for shard in rate_limit_module._requests:
+            for ip, (bucket, count) in shard.items():
+                shard[ip] = (bucket - 2, count)
 
         # Allowed again
         resp = client.post("/evaluate/incoming", json=_EVAL_PAYLOAD)
@@ -97,15 +102,18 @@ class TestInvalidConfig:
 
     def test_non_numeric_limit(self, client, monkeypatch):
         monkeypatch.setenv("ETHOS_RATE_LIMIT", "abc")
+        rate_limit_module.reset_limit()
         resp = client.post("/evaluate/incoming", json=_EVAL_PAYLOAD)
         assert resp.status_code == 200  # Falls back to 10, not crash
 
     def test_zero_limit_floors_to_one(self, client, monkeypatch):
         monkeypatch.setenv("ETHOS_RATE_LIMIT", "0")
+        rate_limit_module.reset_limit()
         resp = client.post("/evaluate/incoming", json=_EVAL_PAYLOAD)
         assert resp.status_code == 200  # Floors to 1, allows first request
 
     def test_negative_limit_floors_to_one(self, client, monkeypatch):
         monkeypatch.setenv("ETHOS_RATE_LIMIT", "-5")
+        rate_limit_module.reset_limit()
         resp = client.post("/evaluate/incoming", json=_EVAL_PAYLOAD)
         assert resp.status_code == 200  # Floors to 1, allows first request
@@ -286,6 +286,44 @@ class TestHardConstraints:
             assert hc["severity"] == "absolute", f"{hc['id']} severity is not absolute"
 
 
+# ── Key lookups ──────────────────────────────────────────────────────
+
+
+class TestConstitutionLookups:
+    """By-key indexes mirror the source lists and reject mutation."""
+
+    def test_hard_constraints_by_id_matches_list(self):
+        from ethos_academy.taxonomy.constitution import (
+            HARD_CONSTRAINTS,
+            HARD_CONSTRAINTS_BY_ID,
+        )
+
+        assert len(HARD_CONSTRAINTS_BY_ID) == len(HARD_CONSTRAINTS)
+        for hc in HARD_CONSTRAINTS:
+            assert HARD_CONSTRAINTS_BY_ID[hc["id"]] is hc
+
+    def test_legitimacy_tests_by_name_matches_list(self):
+        from ethos_academy.taxonomy.constitution import (
+            LEGITIMACY_TESTS,
+            LEGITIMACY_TESTS_BY_NAME,
+        )
+
+        assert set(LEGITIMACY_TESTS_BY_NAME) == {
+            "process",
+            "accountability",
+            "transparency",
+        }
+        assert LEGITIMACY_TESTS_BY_NAME["process"] is LEGITIMACY_TESTS[0]
+
+    def test_indexes_are_read_only(self):
+        import pytest
+
+        from ethos_academy.taxonomy.constitution import HARD_CONSTRAINTS_BY_ID
+
+        with pytest.raises(TypeError):
+            HARD_CONSTRAINTS_BY_ID["HC-99"] = {}
+
+
 # ── Legitimacy Tests ─────────────────────────────────────────────────
 
 
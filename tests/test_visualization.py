@@ -128,6 +128,24 @@ class TestBuildRadialGraph:
         rel_ids = [r.id for r in result.relationships]
         assert len(rel_ids) == len(set(rel_ids))
 
+    def test_constructed_nodes_survive_full_validation(self):
+        """model_construct skips validation, so revalidate every node here.
+
+        Guards the fast path: if a field changes type or a constraint is
+        added to GraphNode, this catches the drift that model_construct
+        would silently let through at runtime.
+        """
+        result = _build_radial_graph(_make_indicator_rows(), _make_agent_rows())
+
+        for node in result.nodes:
+            GraphNode.model_validate(node.model_dump())
+
+    def test_constructed_rels_survive_full_validation(self):
+        result = _build_radial_graph(_make_indicator_rows(), _make_agent_rows())
+
+        for rel in result.relationships:
+            GraphRel.model_validate(rel.model_dump())
+
     def test_hierarchy_relationships(self):
         result = _build_radial_graph(_make_indicator_rows(), [])
 